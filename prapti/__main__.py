@@ -2,20 +2,27 @@
     Invoke tool for generating markdown chat responses
 
     Usage: `python -m prapti`
+
+    Set the PRAPTI_TIME environment variable to report total execution time on stderr.
+    For a breakdown of startup time use `python -X importtime -m prapti`.
 """
-import time
-start_time = time.perf_counter() # start timing execution as early as possible
+import os
 import sys
 
+report_time = bool(os.environ.get("PRAPTI_TIME"))
+if report_time:
+    import time
+    start_time = time.perf_counter() # start timing execution as early as possible
+
 from . import tool
 
 def timed_main():
     exit_code = tool.main()
     end_time = time.perf_counter()
     total_time = (end_time - start_time)
-    print(f"Total execution time: {total_time:.6f} seconds")
+    print(f"Total execution time: {total_time:.6f} seconds", file=sys.stderr)
     return exit_code
 
 if __name__ == "__main__":
-    exit_code = timed_main()
+    exit_code = timed_main() if report_time else tool.main()
     sys.exit(exit_code)
@@ -1,6 +1,7 @@
 """
     Private data used by core only. You shouldn't be here unless you're working on core.
 """
+from typing import Any
 from dataclasses import dataclass, field
 
 from .plugin import Plugin
@@ -8,6 +9,7 @@ from .action import ActionNamespace
 from .responder import ResponderContext
 from .hooks import HooksDistributor
 from .execution_state import ExecutionState
+from .logger import ScopedDiagnosticsLogger
 
 @dataclass
 class CoreExecutionState: # private to core
@@ -15,12 +17,15 @@ class CoreExecutionState: # private to core
     actions: ActionNamespace = field(default_factory=ActionNamespace)
     responder_contexts: dict[str, ResponderContext] = field(default_factory=dict) # keyed by responder instance name
     hooks_distributor: HooksDistributor = field(default_factory=HooksDistributor)
+    plugin_logs: dict[str, ScopedDiagnosticsLogger] = field(default_factory=dict) # keyed by plugin name
+    leaf_plugin_configs: tuple[Any, list[tuple[str, Any]]]|None = None # cached (plugins_namespace, [(dotted_path, config) for each plugin config]). None when invalid
 
 def get_private_core_state(state: ExecutionState) -> CoreExecutionState:
     """
         Access point to very low-level private details that should only be manipulated
         by the core part of the package.
     """
-    if not isinstance(state.private_core_state, CoreExecutionState):
-        raise TypeError("expected a private CoreExecutionState")
+    if __debug__: # type check is skipped when running with python -O
+        if not isinstance(state.private_core_state, CoreExecutionState):
+            raise TypeError("expected a private CoreExecutionState")
     return state.private_core_state
@@ -0,0 +1,103 @@
+"""
+    Persistent cache of installed plugin entry points. Private to core.
+
+    Enumerating entry points with `importlib.metadata` reads the metadata of every
+    distribution on `sys.path`. The result only changes when packages are installed,
+    upgraded or removed, so we store the `name -> "module:attr"` mapping in
+    `$XDG_CACHE_HOME/prapti/entrypoints.json` (default `~/.cache/prapti/entrypoints.json`).
+
+    The cache is keyed on `sys.path`, the modification times of the `sys.path` entries, and the
+    names and modification times of each `*.dist-info`/`*.egg-info` directory and its `entry_points.txt`.
+    This detects the usual install, upgrade and uninstall operations, but not every possible change:
+    for example, an edit that preserves the file modification time, or a distribution metadata
+    directory that is not directly in a `sys.path` entry. Run `prapti --rescan-plugins` to force a rescan.
+"""
+import importlib.metadata
+import hashlib
+import json
+import os
+import pathlib
+import sys
+
+PLUGIN_ENTRY_POINT_GROUP = "prapti.plugin"
+
+_CACHE_FORMAT_VERSION = 1
+
+def _cache_file_path() -> pathlib.Path:
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME", None)
+    cache_home = pathlib.Path(xdg_cache_home) if xdg_cache_home else pathlib.Path.home() / ".cache"
+    return cache_home / "prapti" / "entrypoints.json"
+
+def _mtime_ns(path: str) -> int|None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _distribution_metadata_mtimes(path_entry: str) -> list[tuple[str, int|None, int|None]]:
+    """Return `(name, dir_mtime_ns, entry_points_txt_mtime_ns)` for each distribution metadata directory in `path_entry`."""
+    result = []
+    try:
+        with os.scandir(path_entry) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name.endswith((".dist-info", ".egg-info")):
+                    result.append((dir_entry.name, _mtime_ns(dir_entry.path), _mtime_ns(os.path.join(dir_entry.path, "entry_points.txt"))))
+    except OSError: # not a directory (e.g. a zip file), or not readable
+        pass
+    result.sort()
+    return result
+
+def _compute_cache_key() -> str:
+    hasher = hashlib.sha256()
+    for path_entry in sys.path:
+        path_entry = path_entry or "."
+        hasher.update(f"{path_entry}\0{_mtime_ns(path_entry)}\n".encode("utf-8", errors="surrogateescape"))
+        for name, dir_mtime_ns, entry_points_mtime_ns in _distribution_metadata_mtimes(path_entry):
+            hasher.update(f"\t{name}\0{dir_mtime_ns}\0{entry_points_mtime_ns}\n".encode("utf-8", errors="surrogateescape"))
+    return hasher.hexdigest()
+
+def _read_cache(cache_path: pathlib.Path, key: str) -> dict[str, str]|None:
+    """Return the cached `name -> entry point value` mapping, or None if the cache is missing, stale or unreadable."""
+    try:
+        cache_data = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cache_data["format_version"] != _CACHE_FORMAT_VERSION or cache_data["key"] != key:
+            return None
+        entry_points = cache_data["entry_points"]
+        if not isinstance(entry_points, dict):
+            return None
+        return entry_points
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _write_cache(cache_path: pathlib.Path, key: str, entry_points: dict[str, str]) -> None:
+    cache_data = {"format_version": _CACHE_FORMAT_VERSION, "key": key, "entry_points": entry_points}
+    # write to a temporary file then rename, so that concurrent prapti processes never see a partial file
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(cache_data), encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # the cache is an optimization only. clean up and carry on without it
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def load_plugin_entry_points(rescan: bool=False) -> dict[str, importlib.metadata.EntryPoint]:
+    """Return all installed prapti plugin entry points, keyed by entry point name.
+    Nothing is imported. Use the persistent cache if it is valid, unless `rescan` is `True`."""
+    cache_path = _cache_file_path()
+    key = _compute_cache_key()
+    if not rescan and (cached_entry_points := _read_cache(cache_path, key)) is not None:
+        return {
+            name: importlib.metadata.EntryPoint(name=name, value=value, group=PLUGIN_ENTRY_POINT_GROUP)
+            for name, value in cached_entry_points.items()
+        }
+
+    result = {
+        entry_point.name: entry_point
+        for entry_point in importlib.metadata.entry_points(group=PLUGIN_ENTRY_POINT_GROUP)
+    }
+    _write_cache(cache_path, key, {name: entry_point.value for name, entry_point in result.items()})
+    return result
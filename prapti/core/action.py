@@ -2,8 +2,8 @@
     Actions are wrappers for functions that are triggered by `%`-commands embedded in the markdown
 """
 from dataclasses import dataclass
-from typing import Callable, Any
-from collections import defaultdict
+from typing import Callable, Any, Iterator
+import sys
 
 from .command_message import Message
 from .execution_state import ExecutionState
@@ -31,27 +31,50 @@ class Action:
 
 class ActionNamespace:
     def __init__(self):
-        # actions keyed by unqualified name
-        self._actions: defaultdict[str, list[Action]] = defaultdict(list)
+        # actions keyed by unqualified name. nearly all unqualified names map to a single action,
+        # which is stored directly. the value is promoted to a list when names collide.
+        self._actions: dict[str, Action|list[Action]] = {}
+        # actions keyed by qualified name, for fast exact-match lookup.
+        # if multiple actions share a qualified name, the first one added wins,
+        # consistent with the in-order search of the unqualified-name list.
+        self._actions_by_qualified_name: dict[str, Action] = {}
+
+    def _iter_actions(self) -> Iterator[Action]:
+        for v in self._actions.values():
+            if isinstance(v, list):
+                yield from v
+            else:
+                yield v
+
+    def _insert_action(self, action: Action) -> None:
+        existing = self._actions.get(action.unqualified_name, None)
+        if existing is None:
+            self._actions[action.unqualified_name] = action
+        elif isinstance(existing, list):
+            existing.append(action)
+        else:
+            self._actions[action.unqualified_name] = [existing, action]
+        self._actions_by_qualified_name.setdefault(action.qualified_name, action)
 
     def merge(self, other: 'ActionNamespace') -> None:
         """Update the namespace with actions from *other* by
            merging actions from *other* into the list of existing actions with a given name."""
-        for k,v in other._actions.items():
-            self._actions[k] += v
+        for action in other._iter_actions():
+            self._insert_action(action)
 
     def _add_action(self, raw_qualified_name: str, function: Callable[[str, str, ActionContext], None|str|Message], exclamation_only:bool|None=None):
-        qualified_name = raw_qualified_name.lstrip("!")
-        unqualified_name = qualified_name.split(".")[-1]
+        name_has_exclamation = raw_qualified_name[:1] == "!"
+        qualified_name = sys.intern(raw_qualified_name[1:] if name_has_exclamation else raw_qualified_name)
+        dot_index = qualified_name.rfind(".")
+        unqualified_name = sys.intern(qualified_name[dot_index + 1:] if dot_index >= 0 else qualified_name)
 
         # if either the provided qualified name starts with '!' or exclamation_only == True, it's a exclamation_only command
         # otherwise it's not exclamation_only
-        name_has_exclamation = raw_qualified_name.startswith("!")
         if name_has_exclamation and exclamation_only is False:
             raise ValueError("conflicting parameters: name starts with '!' indicating !-only, but 'exclamation_only' argument is False")
         exclamation_only = name_has_exclamation or exclamation_only is True
         action = Action(qualified_name=qualified_name, unqualified_name=unqualified_name, function=function, exclamation_only=exclamation_only)
-        self._actions[unqualified_name].append(action)
+        self._insert_action(action)
 
     def add_action(self, raw_qualified_name: str, exclamation_only:bool|None=None):
         """a decorator for adding actions to the namespace"""
@@ -61,20 +84,22 @@ class ActionNamespace:
         return decorator
 
     def set_plugin_config_and_log(self, plugin_config: Any, plugin_log: DiagnosticsLogger):
-        for _,v in self._actions.items():
-            for action in v:
-                action.plugin_config = plugin_config
-                action.plugin_log = plugin_log
+        for action in self._iter_actions():
+            action.plugin_config = plugin_config
+            action.plugin_log = plugin_log
 
     def lookup_action(self, name: str) -> list[Action]:
+        # fast path: exact match on qualified name
+        if action := self._actions_by_qualified_name.get(name, None):
+            return [action]
+        # slow path: match on unqualified name, which may be ambiguous
         name_components = name.split('.')
         unqualified_name = name_components[-1]
-        if matches := self._actions.get(unqualified_name, None):
-            if len(matches) == 1:
-                return [matches[0]]
-            else:
-                for action in matches:
-                    if action.qualified_name == name:
-                        return [action]
-                return matches
-        return []
+        match self._actions.get(unqualified_name, None):
+            case None:
+                return []
+            case list() as matches:
+                # no exact qualified-name match (that was handled above), so the name is ambiguous
+                return list(matches)
+            case action:
+                return [action]
@@ -1,22 +1,25 @@
 """
     Builtin actions.
 """
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Callable, Iterator, Mapping, NamedTuple
+import sys
+import re
 import types
 import json
+import functools
 import importlib.metadata
-from dataclasses import dataclass
 
 import pydantic
 from cancel_token import CancellationToken
 
-from ._core_execution_state import get_private_core_state
+from ._core_execution_state import CoreExecutionState, get_private_core_state
+from ._entrypoint_cache import load_plugin_entry_points
 from .execution_state import ExecutionState
-from .configuration import EmptyPluginConfiguration, EmptyResponderConfiguration, RootConfiguration, VarRef, VarEntry, NotSet, resolve_var_ref, resolve_var_ref_field_assignment, setup_newly_constructed_config, get_subobject
+from .configuration import EmptyPluginConfiguration, EmptyResponderConfiguration, RootConfiguration, VarRef, VarEntry, NotSet, resolve_var_ref, resolve_var_ref_field_assignment, has_var_ref_assignments, setup_newly_constructed_config, get_subobject
 from .command_message import Message
 from .action import ActionNamespace, ActionContext
 from .responder import ResponderContext
-from .hooks import Hooks, HooksContext
+from .hooks import Hooks, HooksContext, hooks_override
 from .source_location import SourceLocation
 from .logger import DiagnosticsLogger, ScopedDiagnosticsLogger
 from .plugin import Plugin, PluginCapabilities, PluginContext
@@ -25,16 +28,23 @@ builtin_actions: ActionNamespace = ActionNamespace()
 
 # plugin version check -------------------------------------------------------
 
-@dataclass
-class Version:
+semver_regex = re.compile(r"^(\d+)\.(\d+)\.(\d+)\Z", re.ASCII) # basic major.minor.patch semver only
+
+class Version(NamedTuple):
     major: int
     minor: int
     patch: int
 
+# version strings are drawn from a small set: the API version and the API versions declared by installed plugins.
+# Version is immutable, so cached results can be shared safely.
+@functools.lru_cache(maxsize=64)
 def parse_semver(version: str) -> Version:
-    parts = version.split(".") # basic major.minor.patch semver only
-    return Version(major=int(parts[0]), minor=int(parts[1]), patch=int(parts[2]))
+    match = semver_regex.match(version)
+    if not match:
+        raise ValueError(f"invalid version '{version}'. expected major.minor.patch")
+    return Version(major=int(match[1]), minor=int(match[2]), patch=int(match[3]))
 
+@functools.lru_cache(maxsize=128)
 def plugin_version_is_compatible(prapti_api_version: str, plugin_api_version: str):
     """determine compatibility based on semver semantics. see https://semver.org/"""
     prapti_api_version_v = parse_semver(prapti_api_version)
@@ -54,7 +64,8 @@ PRAPTI_API_VERSION = "1.0.0"
 # Plugin loading proceeds in the following steps:
 #   1. at startup, eagerly create a dict of all available prapti.plugin `EntryPoint`s,
 #      without loading anything. Plugin discovery is implemented using the standard
-#      Python entry point mechanism via `importlib.metadata`.
+#      Python entry point mechanism via `importlib.metadata`. The discovered entry
+#      points are cached on disk between runs (see `_entrypoint_cache.py`).
 #   2. on demand, load the entry point itself, which is an instance of prapti Plugin.
 #      This step uses `importlib.metadata` to load the module that implements the plugin.
 #   3. on demand, use the Plugin instance to instantiate the plugin's capabilities
@@ -64,20 +75,32 @@ PRAPTI_API_VERSION = "1.0.0"
 # performed, and to allow multiple execution states to coexist, each with its own set
 # of loaded plugins.
 
-installed_plugin_entry_points: dict[str, importlib.metadata.EntryPoint] = {
-    entry_point.name: entry_point
-    for entry_point in importlib.metadata.entry_points(group="prapti.plugin")
-}
-
-if not installed_plugin_entry_points:
-    print("warning: prapti: no plugins found. install with pip to register plugins.")
+@functools.cache
+def get_installed_plugin_entry_points() -> Mapping[str, importlib.metadata.EntryPoint]:
+    """Return the installed plugin entry points, keyed by entry point name.
+    Entry points are discovered on first use, not at import time."""
+    result = load_plugin_entry_points()
+    if not result:
+        print("warning: prapti: no plugins found. install with pip to register plugins.")
+    return types.MappingProxyType(result)
 
 loaded_plugin_entry_points: dict[str, Plugin] = {}
 
+# result of loading every installed plugin entry point, for `plugins.list`:
+# (available plugins, names of plugins that could not be loaded). None until first listed.
+_plugin_list_cache: tuple[list[Plugin], list[str]]|None = None
+
+def rescan_installed_plugin_entry_points() -> None:
+    """Bypass the entry point cache, rediscover installed plugins and update the cache."""
+    global _plugin_list_cache
+    _plugin_list_cache = None
+    get_installed_plugin_entry_points.cache_clear()
+    load_plugin_entry_points(rescan=True)
+
 def load_plugin_entry_point(plugin_name, source_loc: SourceLocation, log: DiagnosticsLogger) -> Plugin|None:
     result: Plugin|None = loaded_plugin_entry_points.get(plugin_name, None)
     if not result: # if not already loaded
-        if plugin_entry_point := installed_plugin_entry_points.get(plugin_name, None):
+        if plugin_entry_point := get_installed_plugin_entry_points().get(plugin_name, None):
             try:
                 plugin = plugin_entry_point.load()
                 if plugin.name != plugin_entry_point.name:
@@ -85,6 +108,7 @@ def load_plugin_entry_point(plugin_name, source_loc: SourceLocation, log: Diagno
 
                 if plugin_version_is_compatible(prapti_api_version=PRAPTI_API_VERSION, plugin_api_version=plugin.api_version):
                     result = plugin
+                    loaded_plugin_entry_points[plugin_name] = plugin
                 else:
                     log.error("incompatible-plugin-version", f"couldn't load plugin '{plugin_name}'. plugin API version {plugin.api_version} is not compatible with Prapti API version {PRAPTI_API_VERSION}. you need to upgrade the plugin or downgrade Prapti.")
             except Exception as ex:
@@ -95,14 +119,19 @@ def load_plugin_entry_point(plugin_name, source_loc: SourceLocation, log: Diagno
             log.error("plugin-not-found", f"couldn't load plugin '{plugin_name}'. plugin not found. use `%!plugins.list` to list available plugins.", source_loc)
     return result
 
-def load_plugin(plugin: Plugin, source_loc: SourceLocation, state: ExecutionState) -> None:
+def _get_plugin_log(plugin_name: str, core_state: CoreExecutionState, state: ExecutionState) -> ScopedDiagnosticsLogger:
+    """Return the logger for messages from plugin `plugin_name`, which is shared by the plugin and its responders."""
+    if not (plugin_log := core_state.plugin_logs.get(plugin_name, None)):
+        plugin_log = ScopedDiagnosticsLogger(sink=state.log, scopes=(plugin_name,))
+        core_state.plugin_logs[plugin_name] = plugin_log
+    return plugin_log
+
+def load_plugin(plugin: Plugin, core_state: CoreExecutionState, source_loc: SourceLocation, state: ExecutionState) -> None:
     """Instantiate plugin capabilities and install them into execution state."""
     try:
-        core_state = get_private_core_state(state)
-
-        plugin_log = ScopedDiagnosticsLogger(sink=state.log, scopes=(plugin.name,))
+        plugin_log = _get_plugin_log(plugin.name, core_state, state)
         plugin_context = PluginContext(state=state, plugin_name=plugin.name, root_config=state.root_config, plugin_config=None, log=plugin_log)
-        plugin_context.plugin_config = setup_newly_constructed_config(plugin.construct_configuration(plugin_context), empty_factory=EmptyPluginConfiguration, root_config=state.root_config, log=state.log)
+        plugin_context.plugin_config = setup_newly_constructed_config(plugin.construct_configuration(plugin_context), empty_factory=EmptyPluginConfiguration.model_construct, root_config=state.root_config, log=state.log)
         plugin_actions: ActionNamespace|None = plugin.construct_actions(plugin_context) if PluginCapabilities.ACTIONS in plugin.capabilities else None
         plugin_hooks: Hooks|None = plugin.construct_hooks(plugin_context) if PluginCapabilities.HOOKS in plugin.capabilities else None
 
@@ -119,6 +148,7 @@ def load_plugin(plugin: Plugin, source_loc: SourceLocation, state: ExecutionStat
             config_attach_point = new_attach_point
 
         setattr(config_attach_point, plugin_name, plugin_context.plugin_config)
+        core_state.leaf_plugin_configs = None # invalidate cached list of plugin configurations
 
         if plugin_actions:
             plugin_actions.set_plugin_config_and_log(plugin_context.plugin_config, plugin_context.log)
@@ -128,18 +158,22 @@ def load_plugin(plugin: Plugin, source_loc: SourceLocation, state: ExecutionStat
 
         if plugin_hooks:
             hooks_context = HooksContext(state=state, root_config=state.root_config, plugin_config=plugin_context.plugin_config, hooks=plugin_hooks, log=plugin_context.log)
-            plugin_hooks.on_plugin_loaded(hooks_context)
+            if hooks_override(plugin_hooks, "on_plugin_loaded"):
+                plugin_hooks.on_plugin_loaded(hooks_context)
             core_state.hooks_distributor.add_hooks(hooks_context)
     except Exception as ex:
         state.log.error("load-plugin-exception", f"exception while loading plugin '{plugin.name}': {repr(ex)}", source_loc)
         state.log.debug_exception(ex)
 
-def load_plugin_by_name(plugin_name: str, source_loc: SourceLocation, state: ExecutionState) -> None:
-    core_state = get_private_core_state(state)
-    if plugin_name not in core_state.loaded_plugins:
-        plugin: Plugin|None = load_plugin_entry_point(plugin_name, source_loc, state.log)
-        if plugin:
-            load_plugin(plugin, source_loc, state)
+def load_plugin_by_name(plugin_name: str, core_state: CoreExecutionState, source_loc: SourceLocation, state: ExecutionState) -> Plugin|None:
+    """Load plugin `plugin_name` if it is not already loaded.
+    Return the loaded plugin, or None if the plugin could not be loaded."""
+    if plugin := core_state.loaded_plugins.get(plugin_name, None):
+        return plugin
+    if plugin := load_plugin_entry_point(plugin_name, source_loc, state.log):
+        load_plugin(plugin, core_state, source_loc, state)
+        return core_state.loaded_plugins.get(plugin_name, None)
+    return None
 
 def get_loaded_plugins_info(state: ExecutionState) -> list[dict[str, str]]:
     core_state = get_private_core_state(state)
@@ -156,35 +190,44 @@ def get_loaded_plugins_info(state: ExecutionState) -> list[dict[str, str]]:
 def plugins_load(name: str, raw_args: str, context: ActionContext) -> None|str|Message:
     """Load a plugin. Installs hooks and makes commands/actions available."""
     plugin_name = raw_args.strip()
-    load_plugin_by_name(plugin_name, context.source_loc, context.state)
+    load_plugin_by_name(plugin_name, get_private_core_state(context.state), context.source_loc, context.state)
     return None
 
-def _s(count: int):
-    return "s" if count != 1 else ""
+@functools.cache
+def _plugin_list_row(plugin_name: str, description: str) -> str:
+    # the rendered row does not change between calls, only the " (loaded)" suffix does
+    return f"- **`{plugin_name}`**: {description}"
 
 @builtin_actions.add_action("!prapti.plugins.list")
 def plugins_list(name: str, raw_args: str, context: ActionContext) -> None|str|Message:
     """List available plugins"""
     core_state = get_private_core_state(context.state)
 
-    available_plugins: list[Plugin] = []
-    bad_plugin_names: list[str] = []
-    for plugin_name in installed_plugin_entry_points:
-        plugin: Plugin|None = load_plugin_entry_point(plugin_name, context.source_loc, context.log)
-        if plugin:
-            available_plugins.append(plugin)
-        else:
-            bad_plugin_names.append(plugin_name)
+    global _plugin_list_cache
+    if _plugin_list_cache is None:
+        # installed entry points don't change within a process (unless rescanned), so only load them once
+        available_plugins: list[Plugin] = []
+        bad_plugin_names: list[str] = []
+        for plugin_name in get_installed_plugin_entry_points():
+            plugin: Plugin|None = load_plugin_entry_point(plugin_name, context.source_loc, context.log)
+            if plugin:
+                available_plugins.append(plugin)
+            else:
+                bad_plugin_names.append(plugin_name)
+        _plugin_list_cache = (available_plugins, bad_plugin_names)
+    available_plugins, bad_plugin_names = _plugin_list_cache
 
     if len(available_plugins) > 0:
-        plugin_lines = [f"- **`{plugin.name}`**: {plugin.description}{' (loaded)' if plugin.name in core_state.loaded_plugins else ''}" for plugin in available_plugins]
-        content = f"Available plugin{_s(len(available_plugins))}:\n\n" + "\n".join(plugin_lines)
+        loaded_plugins = core_state.loaded_plugins
+        plugin_lines = [_plugin_list_row(plugin.name, plugin.description) + (" (loaded)" if plugin.name in loaded_plugins else "")
+                        for plugin in available_plugins]
+        content = f"Available plugin{'s' if len(available_plugins) != 1 else ''}:\n\n" + "\n".join(plugin_lines)
     else:
         content = "No plugins available."
 
     if len(bad_plugin_names) > 0:
         plugin_lines = "\n".join(f"- **`{name}`**" for name in bad_plugin_names)
-        content += f"\n\nThe following plugin{_s(len(bad_plugin_names))} could not be accessed due to errors:\n\n{plugin_lines}"
+        content += f"\n\nThe following plugin{'s' if len(bad_plugin_names) != 1 else ''} could not be accessed due to errors:\n\n{plugin_lines}"
 
     return Message("_prapti", "plugins", [content], is_enabled=False)
 
@@ -213,12 +256,15 @@ def delegate_generate_responses(state: ExecutionState, responder_name: str, inpu
 def responder_new(name: str, raw_args: str, context: ActionContext) -> None|str|Message:
     """Create a new responder"""
     core_state = get_private_core_state(context.state)
-    responder_name, plugin_name = raw_args.split()
-    load_plugin_by_name(plugin_name, context.source_loc, context.state)
-    if plugin := core_state.loaded_plugins.get(plugin_name, None):
+    args = raw_args.split(None, 2) # at most 3 parts: enough to detect extra arguments
+    if len(args) != 2:
+        context.log.error("responder-new-bad-args", f"couldn't construct responder. expected '<responder_name> <plugin_name>', got '{raw_args.strip()}'.", context.source_loc)
+        return None
+    responder_name, plugin_name = sys.intern(args[0]), sys.intern(args[1])
+    if plugin := load_plugin_by_name(plugin_name, core_state, context.source_loc, context.state):
         if PluginCapabilities.RESPONDER in plugin.capabilities:
             plugin_config = get_subobject(context.root_config.plugins, plugin_name, None)
-            plugin_log = ScopedDiagnosticsLogger(sink=context.state.log, scopes=(plugin.name,))
+            plugin_log = _get_plugin_log(plugin.name, core_state, context.state)
             plugin_context = PluginContext(
                     state=context.state, plugin_name=plugin_name,
                     root_config=context.root_config, plugin_config=plugin_config, log=plugin_log)
@@ -227,7 +273,7 @@ def responder_new(name: str, raw_args: str, context: ActionContext) -> None|str|
                         state=context.state, plugin_name=plugin_name,
                         root_config=context.root_config, plugin_config=plugin_config, responder_config=None,
                         responder_name=responder_name, responder=responder, log=plugin_context.log)
-                responder_context.responder_config = setup_newly_constructed_config(responder.construct_configuration(responder_context), empty_factory=EmptyResponderConfiguration, root_config=context.root_config, log=context.log)
+                responder_context.responder_config = setup_newly_constructed_config(responder.construct_configuration(responder_context), empty_factory=EmptyResponderConfiguration.model_construct, root_config=context.root_config, log=context.log)
                 core_state.responder_contexts[responder_name] = responder_context
                 setattr(context.root_config.responders, responder_name, responder_context.responder_config)
             else:
@@ -239,7 +285,7 @@ def responder_new(name: str, raw_args: str, context: ActionContext) -> None|str|
 
 @builtin_actions.add_action("prapti.responder.push")
 def responder_push(name: str, raw_args: str, context: ActionContext) -> None|str|Message:
-    responder_name = raw_args.strip()
+    responder_name = sys.intern(raw_args.strip())
     context.root_config.prapti.responder_stack.append(responder_name)
 
 @builtin_actions.add_action("prapti.responder.pop")
@@ -250,93 +296,149 @@ def responder_pop(name: str, raw_args: str, context: ActionContext) -> None|str|
 # configuration inspection ---------------------------------------------------
 
 def _collect_leaf_configs(config_obj, accumulated_path, result) -> None:
-    if isinstance(config_obj, pydantic.BaseModel):
-        result.append((accumulated_path, config_obj))
-    else:
-        assert isinstance(config_obj, types.SimpleNamespace)
-        for field_name,field_value in config_obj.__dict__.items():
-            if field_name.startswith("_"):
-                continue
-            field_path = field_name if not accumulated_path else f"{accumulated_path}.{field_name}"
-            _collect_leaf_configs(field_value, field_path, result)
-
-def _flat_config_dump(contained_in: Any, field_name: str, config_obj, indent, root_config: RootConfiguration, log: DiagnosticsLogger) -> str:
-    result = ""
-    leaf_configs: list[tuple[str,pydantic.BaseModel]] = []
-    _collect_leaf_configs(config_obj, "", leaf_configs)
-    for path, config in leaf_configs:
-        value_dump = _config_dump(contained_in, path, config, indent+4, root_config, log) # REVIEW not sure we have contained_in correct here
-        if "\n" in value_dump:
-            result += f"{' '*indent}- `{path}`\n{value_dump}"
-        elif not value_dump.strip():
-            result += f"{' '*indent}- `{path}` *(no parameters)*\n"
+    """Append `(dotted_path, config)` for each pydantic configuration in the namespace tree rooted at `config_obj`,
+    in depth-first field order."""
+    stack: list[tuple[Any, str]] = [(config_obj, accumulated_path)]
+    while stack:
+        config_obj, accumulated_path = stack.pop()
+        if issubclass(type(config_obj), pydantic.BaseModel):
+            result.append((accumulated_path, config_obj))
         else:
-            result += f"{' '*indent}- `{path} = {value_dump}`\n"
-    return result
+            assert isinstance(config_obj, types.SimpleNamespace)
+            children = [(field_value, f"{accumulated_path}.{field_name}" if accumulated_path else field_name)
+                        for field_name, field_value in config_obj.__dict__.items() if field_name[:1] != "_"]
+            stack.extend(reversed(children))
 
-def _config_dump(contained_in: Any, field_name: str, config_obj, indent, root_config: RootConfiguration, log: DiagnosticsLogger) -> str:
-    result = ""
-    if isinstance(config_obj, pydantic.BaseModel):
-        #if config_obj.__doc__:
-        #    result += f"{' '*indent}{config_obj.__doc__}\n"
-        for field_name, field_info in config_obj.model_fields.items():
-            if field_name.startswith("_"):
-                continue
-            field_value = getattr(config_obj, field_name)
-            field_description = "" # f" -- {field_info.description}" if field_info.description else ""
-
-            if field_name == "plugins":
-                value_dump = _flat_config_dump(config_obj, field_name, field_value, indent+4, root_config, log)
-            else:
-                value_dump = _config_dump(config_obj, field_name, field_value, indent+4, root_config, log)
-            if "\n" in value_dump:
-                result += f"{' '*indent}- `{field_name}`{field_description}\n{value_dump}"
-            elif not value_dump.strip():
-                result += f"{' '*indent}- `{field_name}` *(no parameters)*\n"
-            else:
-                result += f"{' '*indent}- `{field_name} = {value_dump}`{field_description}\n"
-    elif isinstance(config_obj, types.SimpleNamespace):
-        for field_name,field_value in config_obj.__dict__.items():
-            if field_name.startswith("_"):
-                continue
-            value_dump = _config_dump(config_obj, field_name, field_value, indent+4, root_config, log)
-            if "\n" in value_dump:
-                result += f"{' '*indent}- `{field_name}`\n{value_dump}"
-            elif not value_dump.strip():
-                result += f"{' '*indent}- `{field_name}` *(empty)*\n"
-            else:
-                result += f"{' '*indent}- `{field_name} = {value_dump}`\n"
-    elif isinstance(config_obj, VarEntry):
+# bound encoder for configuration values. values are acyclic so the circular reference check is skipped
+_json_encode = json.JSONEncoder(check_circular=False).encode
+
+# the flat list of plugin configurations only changes when a plugin is loaded, so it is cached
+# in the core state together with the namespace it was collected from. `load_plugin` invalidates the cache.
+
+def _leaf_plugin_configs(plugins_namespace: types.SimpleNamespace, core_state: CoreExecutionState) -> list[tuple[str,pydantic.BaseModel]]:
+    """Return `(dotted_path, config)` for each plugin configuration attached under `plugins_namespace`. Do not modify the result."""
+    if (cached := core_state.leaf_plugin_configs) is not None and cached[0] is plugins_namespace:
+        return cached[1]
+    leaf_configs: list[tuple[str,pydantic.BaseModel]] = []
+    _collect_leaf_configs(plugins_namespace, "", leaf_configs)
+    core_state.leaf_plugin_configs = (plugins_namespace, leaf_configs)
+    return leaf_configs
+
+ConfigEntries = list[tuple[str, Any, bool]] # (field_name, field_value, field_value_is_flat)
+
+def _pydantic_config_entries(config_obj: pydantic.BaseModel, field_names: tuple[str, ...], flat_field_name: str|None) -> ConfigEntries:
+    field_values = config_obj.__dict__ # pydantic stores field values in the instance __dict__
+    return [(field_name, field_values[field_name], field_name == flat_field_name) for field_name in field_names]
+
+def _namespace_config_entries(config_obj: types.SimpleNamespace) -> ConfigEntries:
+    return [(field_name, field_value, False)
+            for field_name, field_value in config_obj.__dict__.items() if not field_name.startswith("_")]
+
+def _no_config_entries(config_obj: Any) -> None:
+    return None
+
+# per-type handlers that list the entries of a configuration container. populated on first sighting of each type.
+_config_entries_dispatch: dict[type, Callable[[Any], ConfigEntries|None]] = {
+    VarEntry: _no_config_entries,
+}
+
+def _lookup_config_entries_handler(config_type: type) -> Callable[[Any], ConfigEntries|None]:
+    if handler := _config_entries_dispatch.get(config_type, None):
+        return handler
+    if issubclass(config_type, pydantic.BaseModel):
+        # snapshot the public field names so that the handler iterates a plain tuple
+        field_names = tuple(field_name for field_name in config_type.model_fields if not field_name.startswith("_"))
+        # only the root configuration's `plugins` namespace tree is listed flat
+        flat_field_name = "plugins" if issubclass(config_type, RootConfiguration) else None
+        handler = functools.partial(_pydantic_config_entries, field_names=field_names, flat_field_name=flat_field_name)
+    elif issubclass(config_type, types.SimpleNamespace):
+        handler = _namespace_config_entries
+    else:
+        handler = _no_config_entries
+    _config_entries_dispatch[config_type] = handler
+    return handler
+
+def _config_entries(config_obj, flat: bool, core_state: CoreExecutionState) -> ConfigEntries|None:
+    """Return the `(field_name, field_value, field_value_is_flat)` entries of a configuration container,
+    or None if `config_obj` is not a container (i.e. it is a VarEntry or a field value).
+    If `flat` is True, `config_obj` is a tree of namespaces that is listed as a flat
+    sequence of dotted paths to leaf configurations (used for the root configuration's `plugins`)."""
+    if flat:
+        return [(path, config, False) for path, config in _leaf_plugin_configs(config_obj, core_state)]
+    return _lookup_config_entries_handler(type(config_obj))(config_obj)
+
+def _value_dump(contained_in: Any, field_name: str, config_obj, root_config: RootConfiguration, log: DiagnosticsLogger) -> str:
+    """Format a VarEntry or a field value as a single line of text."""
+    if isinstance(config_obj, VarEntry):
         if config_obj.value is NotSet:
-            result += "(not set)"
+            return "(not set)"
         elif isinstance(config_obj.value, VarRef):
             var_ref_trace, var_entry = resolve_var_ref(config_obj.value, root_config, log)
             var_ref_chain = " = ".join(f"var({vr.var_name})" for vr in var_ref_trace)
             if var_entry.value is NotSet:
-                terminal_value_str = f"(not set) ~> {json.dumps(config_obj.value)}"
+                terminal_value_str = f"(not set) ~> {_json_encode(config_obj.value)}"
             else:
-                terminal_value_str = json.dumps(var_entry.value)
-            result += f"{var_ref_chain} = {terminal_value_str}"
+                terminal_value_str = _json_encode(var_entry.value)
+            return f"{var_ref_chain} = {terminal_value_str}"
         else:
-            result += json.dumps(config_obj.value)
+            return _json_encode(config_obj.value)
     else:
         var_ref_resolution : tuple[list[VarRef], VarEntry]|None = resolve_var_ref_field_assignment(target=contained_in, field_name=field_name, root_config=root_config, log=log)
         if var_ref_resolution is None:
-            result += json.dumps(config_obj)
+            return _json_encode(config_obj)
         else:
             var_ref_trace, var_entry = var_ref_resolution
             var_ref_chain = " = ".join(f"var({vr.var_name})" for vr in var_ref_trace)
             if var_entry.value is NotSet:
-                terminal_value_str = f"(not set) ~> {json.dumps(config_obj)}"
+                terminal_value_str = f"(not set) ~> {_json_encode(config_obj)}"
             else:
-                terminal_value_str = json.dumps(var_entry.value)
-            result += f"{var_ref_chain} = {terminal_value_str}"
-    return result
+                terminal_value_str = _json_encode(var_entry.value)
+            return f"{var_ref_chain} = {terminal_value_str}"
+
+# shared indent strings for nesting levels. _config_dump always indents in steps of 4 spaces
+_max_shared_indent = 64
+_indent_strs = tuple(" " * indent for indent in range(0, _max_shared_indent, 4))
+
+def _config_dump(config_obj, indent: int, root_config: RootConfiguration, core_state: CoreExecutionState, log: DiagnosticsLogger) -> Iterator[str]:
+    """Generate the lines of a markdown list describing the configuration container `config_obj`.
+    The tree is traversed depth-first using an explicit worklist rather than recursion."""
+    # worklist items are either text to output, or (container, container_is_flat, entries, indent) tuples
+    # to be expanded. items are pushed in reverse order so that they are popped in output order.
+    stack: list[str|tuple[Any, bool, ConfigEntries, int]] = []
+    if entries := _config_entries(config_obj, flat=False, core_state=core_state):
+        stack.append((config_obj, False, entries, indent))
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+            continue
+
+        container, container_is_flat, entries, indent = item
+        indent_str = _indent_strs[indent // 4] if indent < _max_shared_indent else " " * indent
+        empty_str = " *(empty)*" if isinstance(container, types.SimpleNamespace) and not container_is_flat else " *(no parameters)*"
+        # fast path: when no var refs are assigned to the container's fields, field values are formatted directly
+        container_has_var_refs = has_var_ref_assignments(container)
+        expansion: list[str|tuple[Any, bool, ConfigEntries, int]] = []
+        for field_name, field_value, field_value_is_flat in entries:
+            field_entries = _config_entries(field_value, field_value_is_flat, core_state)
+            if field_entries is None:
+                if container_has_var_refs or isinstance(field_value, VarEntry):
+                    value_str = _value_dump(container, field_name, field_value, root_config, log)
+                else:
+                    value_str = _json_encode(field_value)
+                expansion.append(f"{indent_str}- `{field_name} = {value_str}`\n")
+            elif field_entries:
+                expansion.append(f"{indent_str}- `{field_name}`\n")
+                expansion.append((field_value, field_value_is_flat, field_entries, indent+4))
+            else:
+                expansion.append(f"{indent_str}- `{field_name}`{empty_str}\n")
+        stack.extend(reversed(expansion))
 
 @builtin_actions.add_action("!prapti.inspect")
 def inspect_config(name: str, raw_args: str, context: ActionContext) -> None|str|Message:
     root_config = context.root_config
+    core_state = get_private_core_state(context.state)
 
-    content = "Configuration parameters:\n\n" + _config_dump(None, "root", root_config, indent=0, root_config=root_config, log=context.log)
+    content = "Configuration parameters:\n\n" + "".join(_config_dump(root_config, indent=0, root_config=root_config, core_state=core_state, log=context.log))
 
     return Message("_prapti", "inspect", [content], is_enabled=False)
@@ -1,7 +1,10 @@
 """
     Parse a chat markdown document into a sequence of messages
 """
+from typing import Iterable
 import re
+import sys
+import io
 import pathlib
 
 from .command_message import Command, Message
@@ -9,40 +12,69 @@ from .source_location import SourceLocation
 
 # match message delimiter headings, typically "### @system:", "### @user:", "### @assistant:"
 # a level-3 ATX heading https://spec.commonmark.org/0.30/#atx-headings
-message_delimiter_regex = re.compile(r"^[ ]{0,3}###\s+(\/\/)?\s*@([\w]+)(?:\/([\w]+))?:?\s*\n")
+message_delimiter_pattern = r"[ ]{0,3}###\s+(?P<message_disabled>\/\/)?\s*@(?P<role>[\w]+)(?:\/(?P<name>[\w]+))?:?\s*\n"
 
 # match single-line configuration commands/assignment: lines starting with %, optionally prefixed with blockquote '>'
 # TODO: don't match config inside <!-- --> comments or inside fenced blocks
-command_line_regex = re.compile(r"^(?:[ ]{0,3}\>\s*)?(\/\/)?\s*%\s*(.*)\n")
+command_line_pattern = r"(?:[ ]{0,3}\>\s*)?(?P<command_disabled>\/\/)?\s*%\s*(?P<command_text>.*)\n"
+
+# match either of the above patterns with a single regex search per line.
+# the alternatives are mutually exclusive: a delimiter starts with '#', a command line never does.
+command_or_message_delimiter_regex = re.compile(f"^(?:{command_line_pattern}|{message_delimiter_pattern})")
 
 def parse_messages(lines: list[str], file_path: pathlib.Path|None) -> list[Message]:
-    """partition lines of a chat markdown document into a sequence of messages."""
+    """partition lines of a chat markdown document into a sequence of messages.
+    `lines` are newline-terminated, except possibly the final line (e.g. as returned by `readlines()`)."""
+    if lines and not lines[-1].endswith("\n"):
+        lines = lines[:-1] + [lines[-1] + "\n"] # make sure the final line parses correctly. don't modify the caller's list
+    return _parse_terminated_lines(lines, file_path)
+
+def parse_messages_from_text(text: str, file_path: pathlib.Path|None) -> list[Message]:
+    """partition the text of a chat markdown document into a sequence of messages.
+    lines are split on newlines only, as with `readlines()`, without building an intermediate list of lines."""
+    if text and not text.endswith("\n"):
+        text += "\n" # make sure the final line parses correctly
+    return _parse_terminated_lines(io.StringIO(text), file_path)
+
+def _parse_terminated_lines(lines: Iterable[str], file_path: pathlib.Path|None) -> list[Message]:
+    """implementation of parse_messages. every line in `lines` must be newline-terminated."""
     current_message = Message(role="_head", name=None, content=[], is_enabled=True, source_loc=SourceLocation(file_path=file_path, line=0))
     result = [current_message]
+    # consecutive content lines are collected here and joined into a single string span when the span ends
+    pending_content_lines: list[str] = []
+    # bind the match method once, rather than looking it up on each line
+    command_or_message_delimiter_match = command_or_message_delimiter_regex.match
     for line_no, line in enumerate(lines, start=1):
-        if not line.endswith("\n"):
-            line = line + "\n" # make sure the final line parses correctly
+        # most lines are plain content. the regex can only match lines that start with whitespace or one of #>/%
+        first_char = line[:1]
+        line_match = (command_or_message_delimiter_match(line)
+                      if first_char in "#>/%" or first_char.isspace() else None)
+        if line_match is None:
+            pending_content_lines.append(line) # append line to current message content
+            continue
+
+        if pending_content_lines:
+            current_message.content.append("".join(pending_content_lines))
+            pending_content_lines.clear()
 
-        if command_match := re.match(command_line_regex, line):
-            is_enabled = command_match.group(1) != "//"
+        if (command_text := line_match.group("command_text")) is not None:
+            is_enabled = line_match.group("command_disabled") != "//"
             source_loc = SourceLocation(file_path=file_path, line=line_no)
-            current_message.content.append(Command(text=command_match.group(2).strip(), is_enabled=is_enabled, source_loc=source_loc))
+            current_message.content.append(Command(text=command_text.strip(), is_enabled=is_enabled, source_loc=source_loc))
 
-        elif message_match := re.match(message_delimiter_regex, line):
+        else:
             # found message delimeter
-            is_enabled = message_match.group(1) != "//"
-            role = message_match.group(2)
-            name = message_match.group(3) if message_match.group(3) else None
+            is_enabled = line_match.group("message_disabled") != "//"
+            # roles and names are drawn from a small set and compared often. intern them
+            role = sys.intern(line_match.group("role"))
+            name = sys.intern(name) if (name := line_match.group("name")) else None
 
             # start new message
             source_loc = SourceLocation(file_path=file_path, line=line_no)
             current_message = Message(role=role, name=name, content=[], is_enabled=is_enabled, source_loc=source_loc)
             result.append(current_message)
-        else:
-            # append line to current mesage content
-            if current_message.content and isinstance(current_message.content[-1], str): #check for non-empty before accessing last element
-                current_message.content[-1] += line
-            else:
-                current_message.content.append(line) # start a new string span
+
+    if pending_content_lines:
+        current_message.content.append("".join(pending_content_lines))
 
     return result
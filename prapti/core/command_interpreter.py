@@ -41,11 +41,12 @@ def run_action(has_exclamation: bool, action_name: str, raw_args: str, source_lo
 # process '%' commands -------------------------------------------------------
 # i.e. set configuration fields and run actions
 
-command_regex = re.compile(r"^(!)?\s*([\w\-_./\\]+)(?:\s*(=)|\s+|$)(.*)")
+command_regex = re.compile(r"(!)?\s*([\w\-_./\\]+)(?:\s*(=)|\s+|$)(.*)")
 # Regex that matches valid command text (starting with the first non-whitespace
 # character after the '%')
 # Explanation:
-# - `^(!)?` matches an optional exclamation mark at the beginning of the command.
+# - the pattern is used with `command_regex.match()`, which anchors it at the start of the command text.
+# - `(!)?` matches an optional exclamation mark at the beginning of the command.
 # - `\s*` matches zero or more whitespace characters (spaces and tabs).
 # - `([\w\-_./\\]+)` matches the command name. It allows alphanumeric characters, hyphens,
 #   underscores, periods, forward slashes, and backslashes.
@@ -65,7 +66,7 @@ def _interpret_command(command_text: str, is_final_message: bool, source_loc: So
     where action-name and field-name have the same permitted characters: alphanumeric, -_./
     """
     result = None
-    if match := re.match(command_regex, command_text):
+    if match := command_regex.match(command_text):
         has_exclamation = bool(match.group(1))
         name = match.group(2)
         equals_sign = match.group(3)
@@ -105,8 +106,8 @@ def interpret_commands(message_sequence: list[Message], state: ExecutionState, i
 # `% config_root = true` helper ----------------------------------------------
 # for loading in-tree .prapticonfig.md files
 
-config_root_regex = re.compile(r"^\s*(prapti\.)?(config_root)\s*(=)\s*(true)\s*")
-# ^^^ Regex that matches `config_root = true` and `prapti.config_root = true`
+config_root_regex = re.compile(r"\s*(prapti\.)?(config_root)\s*(=)\s*(true)\s*")
+# ^^^ Regex that matches `config_root = true` and `prapti.config_root = true` (anchored by `.match()`)
 
 def is_config_root(config_message_sequence: list[Message]) -> bool:
     """given a .prapticonfig.md message sequence, return true if `true` is assigned to `prapti.config_root`, without executing or interpreting any commands."""
@@ -114,6 +115,6 @@ def is_config_root(config_message_sequence: list[Message]) -> bool:
         if message.is_enabled:
             for item in message.content:
                 if isinstance(item, Command) and item.is_enabled:
-                    if re.match(config_root_regex, item.text):
+                    if config_root_regex.match(item.text):
                         return True
     return False
@@ -58,6 +58,11 @@ def flatten_message_content(messages: list[Message]) -> list[Message]:
     """
     response_messages = []
     for message in messages:
+        content = message.content
+        if len(content) == 1 and isinstance(content[0], str):
+            # fast path: the common case of a single text span with no commands
+            message.content = [content[0].strip()]
+            continue
         content_strs = []
         for item in message.content:
             if isinstance(item, str):
@@ -5,12 +5,14 @@
 from dataclasses import dataclass, field
 from typing import Any, TypeVar, Callable
 from types import SimpleNamespace
+import sys
 import json
 import re
+import functools
 
 from pydantic import BaseModel, Field, ConfigDict, ValidationError
 
-from .logger import DiagnosticsLogger
+from .logger import DiagnosticsLogger, DETAIL
 from .source_location import SourceLocation
 
 class PraptiConfiguration(BaseModel):
@@ -24,6 +26,8 @@ class PraptiConfiguration(BaseModel):
 
     responder_stack: list[str] = Field(default_factory=list)
 
+_prapti_field_names = frozenset(PraptiConfiguration.model_fields)
+
 class PluginsConfiguration(SimpleNamespace):
     """Configuration entries for each loaded plugin"""
 
@@ -41,12 +45,12 @@ class NotSetType:
 
 NotSet = NotSetType()
 
-@dataclass
+@dataclass(slots=True)
 class VarRef:
     var_name: str
     source_loc: SourceLocation = field(default_factory=SourceLocation)
 
-@dataclass
+@dataclass(slots=True)
 class VarEntry:
     value: Any|VarRef|NotSetType = NotSet
     value_source_loc: SourceLocation|None = None # loc of value when assigned
@@ -68,7 +72,8 @@ class RootConfiguration(BaseModel):
     """The root of the configuration tree"""
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    prapti: PraptiConfiguration = Field(default_factory=PraptiConfiguration)
+    # trusted defaults: construct without running validation
+    prapti: PraptiConfiguration = Field(default_factory=PraptiConfiguration.model_construct)
 
     plugins: PluginsConfiguration = Field(default_factory=PluginsConfiguration)
 
@@ -78,11 +83,15 @@ class RootConfiguration(BaseModel):
 
 # ---------------------------------------------------------------------------
 
+_missing = object() # sentinel for single-lookup getattr probes
+
 def get_subobject(obj, dotted_name: str, default: Any):
+    if "." not in dotted_name:
+        return getattr(obj, dotted_name, default)
     for component in dotted_name.split("."):
-        if not hasattr(obj, component):
+        obj = getattr(obj, component, _missing)
+        if obj is _missing:
             return default
-        obj = getattr(obj, component)
     return obj
 
 # ---------------------------------------------------------------------------
@@ -152,10 +161,17 @@ def _assign_var(root_config: RootConfiguration, var_field_name: str, parsed_fiel
     fields of pydatic models."""
     assert var_field_name.startswith("vars.")
     var_name = var_field_name[5:] # strip off "vars."
-    value_str = f"var({parsed_field_value.var_name})" if isinstance(parsed_field_value, VarRef) else json.dumps(parsed_field_value)
-    log.detail("set-var", f"setting variable: {var_field_name} = {value_str}", source_loc)
+    if log.is_enabled_for(DETAIL):
+        value_str = f"var({parsed_field_value.var_name})" if isinstance(parsed_field_value, VarRef) else json.dumps(parsed_field_value)
+        log.detail("set-var", f"setting variable: {var_field_name} = {value_str}", source_loc)
     setattr(root_config.vars, var_name, VarEntry(value=parsed_field_value, value_source_loc=source_loc)) # replace existing entry, if any
 
+@functools.lru_cache(maxsize=256)
+def _split_config_field_path(config_field_path: str) -> tuple[tuple[str, ...], str]:
+    """Split `config_field_path` into its namespace components and the final field name"""
+    *sources, field_name = config_field_path.split('.')
+    return tuple(sources), field_name
+
 def _assign_configuration_field(root_config: RootConfiguration, config_field_path: str, parsed_field_value: Any, source_loc: SourceLocation, log: DiagnosticsLogger) -> None:
     """Assign `parsed_field_value` to the field corresponding to `config_field_path`.
     This will trigger pydantic validation for the field assignment.
@@ -164,14 +180,13 @@ def _assign_configuration_field(root_config: RootConfiguration, config_field_pat
     assert not config_field_path.startswith("vars.")
 
     # navigate '.'-separated components from `config_root`` to the `target`` object that has field `field_name``
-    field_name = config_field_path
+    sources, field_name = _split_config_field_path(config_field_path)
     target = root_config
-    while '.' in field_name:
-        source, field_name = field_name.split('.', maxsplit=1)
-        if not hasattr(target, source):
+    for source in sources:
+        target = getattr(target, source, _missing)
+        if target is _missing:
             log.error("unknown-field-component", f"didn't perform configuration assignment. unknown configuration field '{config_field_path}', component '{source}' does not exist", source_loc)
             return
-        target = getattr(target, source)
 
     if hasattr(target, field_name):
         if not isinstance(target, BaseModel):
@@ -181,7 +196,8 @@ def _assign_configuration_field(root_config: RootConfiguration, config_field_pat
             _assign_var_ref(target, field_name, parsed_field_value, root_config)
         else:
             try:
-                log.detail("set-field", f"setting configuration field: {config_field_path} = {json.dumps(parsed_field_value)}", source_loc)
+                if log.is_enabled_for(DETAIL):
+                    log.detail("set-field", f"setting configuration field: {config_field_path} = {json.dumps(parsed_field_value)}", source_loc)
                 setattr(target, field_name, parsed_field_value) # uses pydantic for coercion and validation, may raise exception
                 _clear_var_ref_assignment(target, field_name, root_config) # clear any var ref assignment *only after* new value has been successfully assigned
             except ValidationError as validation_error:
@@ -198,7 +214,7 @@ def _lookup_unscoped_field_name(root_config: RootConfiguration, unscoped_field_n
     prapti_config_field = None
     vars_field = None
 
-    if hasattr(root_config.prapti, unscoped_field_name):
+    if unscoped_field_name in _prapti_field_names:
         prapti_config_field = "prapti." + unscoped_field_name
 
     if hasattr(root_config.vars, unscoped_field_name):
@@ -219,20 +235,18 @@ def _lookup_unscoped_field_name(root_config: RootConfiguration, unscoped_field_n
     log.detail(f"resolved unscoped name '{unscoped_field_name}' to '{scoped_field_name}'", source_loc)
     return scoped_field_name
 
-var_ref_regex = re.compile(r"^\s*var\s*\(\s*([A-Za-z_][\w_]*)\s*\)")
+var_ref_regex = re.compile(r"\s*var\s*\(\s*([A-Za-z_][\w_]*)\s*\)")
 
-def _parse_field_value(field_value_str: str, source_loc: SourceLocation, log: DiagnosticsLogger) -> tuple[bool, Any]:
-    """Parse the right-hand-side of an assignment (the "field value"). This can take the form of
-    valid JSON, or "var(<var-name>)"."""
-    if match := re.match(var_ref_regex, field_value_str):
-        parsed_value = VarRef(var_name=match.group(1), source_loc=source_loc)
-    else:
-        try:
-            parsed_value = json.loads(field_value_str)
-        except (ValueError, SyntaxError) as ex:
-            log.error("config-value-json-parse-error", f"could not parse configuration value '{field_value_str}' as JSON: {repr(ex)}", source_loc)
-            return False, None
-    return True, parsed_value
+@functools.lru_cache(maxsize=512)
+def _parse_json_scalar(field_value_str: str) -> Any:
+    return json.loads(field_value_str)
+
+def _parse_json(field_value_str: str) -> Any:
+    """Parse `field_value_str` as JSON. Scalar results are immutable and are memoized, because the same
+    values are typically assigned many times. Arrays and objects are parsed afresh, because the result may be mutated."""
+    if field_value_str.lstrip()[:1] in ("[", "{"):
+        return json.loads(field_value_str)
+    return _parse_json_scalar(field_value_str)
 
 def assign_field(root_config: RootConfiguration, original_field_name: str, field_value_str: str, source_loc: SourceLocation, log: DiagnosticsLogger) -> None:
     """Implementation of `% fieldname = value` command"""
@@ -241,9 +255,17 @@ def assign_field(root_config: RootConfiguration, original_field_name: str, field
     if not scoped_field_name:
         return
 
-    value_ok, parsed_field_value = _parse_field_value(field_value_str, source_loc, log)
-    if not value_ok:
-        return
+    # parse the right-hand-side of the assignment (the "field value").
+    # this can take the form of valid JSON, or "var(<var-name>)"
+    parsed_field_value: Any
+    if match := var_ref_regex.match(field_value_str):
+        parsed_field_value = VarRef(var_name=sys.intern(match.group(1)), source_loc=source_loc)
+    else:
+        try:
+            parsed_field_value = _parse_json(field_value_str)
+        except (ValueError, SyntaxError) as ex:
+            log.error("config-value-json-parse-error", f"could not parse configuration value '{field_value_str}' as JSON: {repr(ex)}", source_loc)
+            return
 
     if scoped_field_name.startswith("vars."):
         _assign_var(root_config=root_config, var_field_name=scoped_field_name, parsed_field_value=parsed_field_value, source_loc=source_loc, log=log)
@@ -256,18 +278,20 @@ def assign_field(root_config: RootConfiguration, original_field_name: str, field
 _VAR_REF_CHAIN_LIMIT = 20
 
 def _resolve_var_ref(var_ref: VarRef, trace: list[VarRef], root_config: RootConfiguration, log: DiagnosticsLogger) -> VarEntry:
-    trace.append(var_ref)
-    if len(trace) > _VAR_REF_CHAIN_LIMIT:
-        chain = " = ".join(f"var({vr.var_name})" for vr in trace)
-        log.error("var-ref-chain-limit-reached", f"did not resolve value for variable '{trace[0].var_name}'. halted on possible reference cycle: {chain}")
-        return VarEntry()
-
-    var_entry = getattr(root_config.vars, var_ref.var_name, None)
-    if var_entry is None:
-        return VarEntry(value=NotSet)
-    if not isinstance(var_entry.value, VarRef): # JSON-compatible value or NotSet
-        return var_entry
-    return _resolve_var_ref(var_entry.value, trace, root_config, log)
+    """Follow the chain of var refs starting at `var_ref`, appending each visited var ref to `trace`."""
+    while True:
+        trace.append(var_ref)
+        if len(trace) > _VAR_REF_CHAIN_LIMIT:
+            chain = " = ".join(f"var({vr.var_name})" for vr in trace)
+            log.error("var-ref-chain-limit-reached", f"did not resolve value for variable '{trace[0].var_name}'. halted on possible reference cycle: {chain}")
+            return VarEntry()
+
+        var_entry = getattr(root_config.vars, var_ref.var_name, None)
+        if var_entry is None:
+            return VarEntry(value=NotSet)
+        if not isinstance(var_entry.value, VarRef): # JSON-compatible value or NotSet
+            return var_entry
+        var_ref = var_entry.value
 
 def resolve_var_ref(var_ref: VarRef, root_config: RootConfiguration, log: DiagnosticsLogger) -> tuple[list[VarRef], VarEntry]:
     """Find the terminal VarEntry addressed by var_ref, if necessary, traverse chains of var_refs assigned to other var_refs.
@@ -276,6 +300,10 @@ def resolve_var_ref(var_ref: VarRef, root_config: RootConfiguration, log: Diagno
     var_entry = _resolve_var_ref(var_ref, trace, root_config, log)
     return trace, var_entry
 
+def has_var_ref_assignments(target: Any) -> bool:
+    """Return True if any VarRef has been assigned to a field of `target`. Used for debugging/inspection only."""
+    return bool(getattr(target, "_prapti_var_ref_assignments", None))
+
 def resolve_var_ref_field_assignment(target: BaseModel, field_name: str, root_config: RootConfiguration, log: DiagnosticsLogger) -> tuple[list[VarRef], VarEntry]|None:
     """Find the terminal VarEntry for `target.field_name` if and only if a VarRef has been assigned to `field_name`,
     otherwise return None. Used for debugging/inspection only."""
@@ -294,20 +322,27 @@ def resolve_var_refs(target: Model, root_config: RootConfiguration, log: Diagnos
         # target has no VarRef assignments
         return target
 
-    result = target.model_copy()
-
-    # iterate through all var_ref -> field assignments and assign to each field separately
-    # so that we can give precise validation errors
-    # NOTE: we don't use model_copy(update=...) because it doesn't peform validation
+    resolved_fields: dict[str, tuple[list[VarRef], VarEntry]] = {}
     for field_name, var_ref in target_var_ref_assignments.items():
         var_ref_trace, var_entry = resolve_var_ref(var_ref, root_config, log)
         if var_entry.value_is_set:
-            try:
-                setattr(result, field_name, var_entry.value) # uses pydantic for coercion and validation, may raise exception
-            except ValidationError as validation_error:
-                var_ref_chain = " = ".join(f"var({vr.var_name})" for vr in var_ref_trace)
-                assignment_chain = f"{field_name} = {var_ref_chain} = {json.dumps(var_entry.value)}"
-                log.error("invalid-late-bound-field-assignment", f"could not bind variable value to field: {assignment_chain}: {str(validation_error)}", var_entry.value_source_loc)
+            resolved_fields[field_name] = (var_ref_trace, var_entry)
+
+    if not resolved_fields:
+        # none of the referenced vars are set, field defaults apply
+        return target
+
+    result = target.model_copy()
+
+    # assign to each field separately so that we can give precise validation errors
+    # NOTE: we don't use model_copy(update=...) because it doesn't peform validation
+    for field_name, (var_ref_trace, var_entry) in resolved_fields.items():
+        try:
+            setattr(result, field_name, var_entry.value) # uses pydantic for coercion and validation, may raise exception
+        except ValidationError as validation_error:
+            var_ref_chain = " = ".join(f"var({vr.var_name})" for vr in var_ref_trace)
+            assignment_chain = f"{field_name} = {var_ref_chain} = {json.dumps(var_entry.value)}"
+            log.error("invalid-late-bound-field-assignment", f"could not bind variable value to field: {assignment_chain}: {str(validation_error)}", var_entry.value_source_loc)
     return result
 
 # ----------------------------------------------------------------------------
@@ -316,17 +351,19 @@ def setup_newly_constructed_config(constructed_config: BaseModel|tuple[BaseModel
     """Process the result of constructing a new plugin or responder configuration.
     Assign specified var refs to fields.
     If the constructed config is None construct an appropriate empty config."""
-    if constructed_config:
-        if isinstance(constructed_config, tuple):
-            the_config, field_var_ref_assignments = constructed_config
-            for field_name, var_ref in field_var_ref_assignments:
-                if not field_name in the_config.model_fields:
-                    log.warning("setup-assign-var-ref-to-nonexistant-field", f"setup: can't set field `{field_name}` to `var({var_ref.var_name})`. field doesn't exist.")
-                _assign_var_ref(the_config, field_name, var_ref, root_config)
-                if not hasattr(root_config.vars, var_ref.var_name):
-                    # create entries for vars, if they don't already exist
-                    setattr(root_config.vars, var_ref.var_name, VarEntry(value=NotSet, value_source_loc=SourceLocation()))
-            return the_config
-        else:
-            return constructed_config
-    return empty_factory()
+    if constructed_config is None:
+        # common case: many plugins and responders have no configuration
+        return empty_factory()
+    if isinstance(constructed_config, tuple):
+        the_config, field_var_ref_assignments = constructed_config
+        model_fields = type(the_config).model_fields
+        root_config_vars = root_config.vars
+        for field_name, var_ref in field_var_ref_assignments:
+            if field_name not in model_fields:
+                log.warning("setup-assign-var-ref-to-nonexistant-field", f"setup: can't set field `{field_name}` to `var({var_ref.var_name})`. field doesn't exist.")
+            _assign_var_ref(the_config, field_name, var_ref, root_config)
+            if not hasattr(root_config_vars, var_ref.var_name):
+                # create entries for vars, if they don't already exist
+                setattr(root_config_vars, var_ref.var_name, VarEntry(value=NotSet, value_source_loc=SourceLocation()))
+        return the_config
+    return constructed_config
@@ -8,7 +8,7 @@ from .execution_state import ExecutionState
 from .configuration import RootConfiguration
 from ..core.logger import DiagnosticsLogger
 
-@dataclass
+@dataclass(slots=True)
 class HooksContext:
     state: ExecutionState
     root_config: RootConfiguration
@@ -35,32 +35,54 @@ class Hooks:
     def on_response_completed(self, context: HooksContext):
         pass
 
+def hooks_override(hooks: Hooks, hook_name: str) -> bool:
+    """Return True if `hooks` overrides the no-op base class implementation of `hook_name`."""
+    return getattr(type(hooks), hook_name) is not getattr(Hooks, hook_name)
+
 class HooksDistributor:
     def __init__(self):
         self._hooks_contexts: list[HooksContext] = []
+        # per-event (bound hook method, context) tuples, containing only hooks that override the no-op
+        # base class implementation. rebuilt whenever hooks are added or removed
+        self._on_plugin_loaded_handlers: tuple[tuple[typing.Callable, HooksContext], ...] = ()
+        self._on_generating_response_handlers: tuple[tuple[typing.Callable, HooksContext], ...] = ()
+        self._on_lookup_active_responder_handlers: tuple[tuple[typing.Callable, HooksContext], ...] = ()
+        self._on_response_completed_handlers: tuple[tuple[typing.Callable, HooksContext], ...] = ()
+
+    def _event_handlers(self, hook_name: str) -> tuple[tuple[typing.Callable, HooksContext], ...]:
+        return tuple((getattr(context.hooks, hook_name), context)
+                        for context in self._hooks_contexts if hooks_override(context.hooks, hook_name))
+
+    def _update_handlers(self):
+        self._on_plugin_loaded_handlers = self._event_handlers("on_plugin_loaded")
+        self._on_generating_response_handlers = self._event_handlers("on_generating_response")
+        self._on_lookup_active_responder_handlers = self._event_handlers("on_lookup_active_responder")
+        self._on_response_completed_handlers = self._event_handlers("on_response_completed")
 
     def add_hooks(self, hooks_context: HooksContext):
         self._hooks_contexts.append(hooks_context)
+        self._update_handlers()
 
     def remove_hooks(self, hooks_context: HooksContext):
         self._hooks_contexts.remove(hooks_context)
+        self._update_handlers()
 
     def on_plugin_loaded(self):
-        for context in self._hooks_contexts:
-            context.hooks.on_plugin_loaded(context)
+        for hook, context in self._on_plugin_loaded_handlers:
+            hook(context)
 
     def on_generating_response(self):
-        for context in self._hooks_contexts:
-            context.hooks.on_generating_response(context)
+        for hook, context in self._on_generating_response_handlers:
+            hook(context)
 
     def on_lookup_active_responder(self, responder_name: str) -> str:
-        for context in self._hooks_contexts:
-            responder_name = context.hooks.on_lookup_active_responder(responder_name, context)
+        for hook, context in self._on_lookup_active_responder_handlers:
+            responder_name = hook(responder_name, context)
         return responder_name
 
     def on_response_completed(self):
-        for context in self._hooks_contexts:
-            context.hooks.on_response_completed(context)
+        for hook, context in self._on_response_completed_handlers:
+            hook(context)
 
 # ^^^ END UNDER CONSTRUCTION /////////////////////////////////////////////////
 # ----------------------------------------------------------------------------
@@ -5,21 +5,23 @@
     - `.prapticonfig.md` from directory containing input file, and parent directories
 """
 import os
+import stat
 import pathlib
 
 from .logger import DiagnosticsLogger
 from ..core.execution_state import ExecutionState
 from ..core.command_message import Message
-from ..core.chat_markdown_parser import parse_messages
+from ..core.chat_markdown_parser import parse_messages_from_text
 from ..core.command_interpreter import interpret_commands, is_config_root
 
 FALLBACK_CONFIG_FILE_DATA = """\
 % plugins.load openai.chat
 % responder.new default openai.chat
 """
+FALLBACK_CONFIG_FILE_PATH = pathlib.Path("<fallback-config>")
 
-def parse_messages_and_interpret_commands(lines: list[str], file_path: pathlib.Path, state: ExecutionState):
-    message_sequence: list[Message] = parse_messages(lines, file_path)
+def parse_messages_and_interpret_commands(text: str, file_path: pathlib.Path, state: ExecutionState):
+    message_sequence: list[Message] = parse_messages_from_text(text, file_path)
     interpret_commands(message_sequence, state)
     state.message_sequence += message_sequence
 
@@ -32,8 +34,7 @@ def load_config_file(config_path: pathlib.Path, state: ExecutionState) -> bool:
         state.log.info("loading-config-file", "loading configuration file", config_path)
         state.config_file_paths.append(config_path)
         try:
-            config_file_lines = config_path.read_text(encoding="utf-8").splitlines(keepends=True)
-            parse_messages_and_interpret_commands(config_file_lines, config_path, state)
+            parse_messages_and_interpret_commands(config_path.read_text(encoding="utf-8"), config_path, state)
         except Exception as ex:
             state.log.error("config-file-exception", f"exception while loading configuration file: {repr(ex)}", config_path)
             state.log.debug_exception(ex)
@@ -57,7 +58,7 @@ def locate_user_prapti_config_dir(log: DiagnosticsLogger) -> pathlib.Path | None
     if xdg_config_home: # set, not empty
         log.detail("using user config dir '$XDG_CONFIG_HOME/prapti' because the XDG_CONFIG_HOME environment variable is set")
         xdg_config_home_path = pathlib.Path(xdg_config_home)
-        if xdg_config_home_path.exists() and xdg_config_home_path.is_dir():
+        if xdg_config_home_path.is_dir():
             result = xdg_config_home_path / "prapti"
         else:
             log.warning("bad-xdg-config-home", f"will not load user config. XDG_CONFIG_HOME environment variable is set to '{xdg_config_home}' but this is not an existing directory")
@@ -65,16 +66,15 @@ def locate_user_prapti_config_dir(log: DiagnosticsLogger) -> pathlib.Path | None
     else: # XDG_CONFIG_HOME environment var empty or not set
         # try the default XDG path
         log.detail("checking for user config dir at '$HOME/.config/prapti'")
-        default_xdg_config_home = pathlib.Path.home() / ".config"
-        if (default_xdg_config_home / "prapti").exists():
+        home = pathlib.Path.home()
+        result = home / ".config" / "prapti"
+        if not result.exists():
             # if there is an XDG-compatible prapti directory, always use it, don't check $HOME/.prapti
-            result = default_xdg_config_home / "prapti"
-        else:
-            # fall back to legacy configuration file location
+            # otherwise fall back to legacy configuration file location
             log.detail("checking for user config dir at '$HOME/.prapti'")
-            result = pathlib.Path.home() / '.prapti'
+            result = home / '.prapti'
 
-    if result.exists() and result.is_dir():
+    if result.is_dir(): # is_dir() is False for non-existent paths
         log.detail(f"using user config dir '{result}'")
         return result
     else:
@@ -87,13 +87,37 @@ def locate_user_config_file(prapti_user_config_dir: pathlib.Path, log: Diagnosti
     `locate_user_prapti_config_dir()`
     """
     result = prapti_user_config_dir / "config.md"
-    if result.exists() and result.is_file():
+    if result.is_file(): # is_file() is False for non-existent paths
         log.detail(f"using user config.md file '{result}'")
         return result
     else:
         log.detail("no user config.md file found (not a problem unless you thought you'd created one)")
         return None
 
+def _read_regular_file_text(path: pathlib.Path) -> str|None:
+    """Return the text of `path` if it is an existing regular file, otherwise return None.
+    Most directories have no config file, so open the path directly and check the file type
+    of the open file, rather than stat-ing the path before opening it."""
+    try:
+        # non-blocking so that opening a FIFO does not wait for a writer
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+        return None
+    except PermissionError:
+        if not path.is_file(): # e.g. opening a directory on Windows
+            return None
+        raise
+    try:
+        is_regular_file = stat.S_ISREG(os.fstat(fd).st_mode)
+    except BaseException:
+        os.close(fd)
+        raise
+    if not is_regular_file:
+        os.close(fd)
+        return None
+    with open(fd, "rt", encoding="utf-8") as file:
+        return file.read()
+
 def locate_and_parse_in_tree_prapticonfig_md_files(state: ExecutionState) -> tuple[bool, list[tuple[pathlib.Path, list[Message]|None]]]:
     """Search for in-tree `.prapticonfig.md` files and parse each file.
     Algorithm: (.editorconfig algorithm) starting from the directory containing the input markdown file,
@@ -109,15 +133,15 @@ def locate_and_parse_in_tree_prapticonfig_md_files(state: ExecutionState) -> tup
     for parent in state.input_file_path.resolve().parents: # traverse from containing dir to root
         config_path = parent / ".prapticonfig.md"
         message_sequence: list[Message]|None = None
-        if config_path.is_file():
+        try:
+            if (config_text := _read_regular_file_text(config_path)) is not None:
+                found_config_file = True
+                state.log.detail("reading-in-tree-config", "reading configuration file", config_path)
+                message_sequence = parse_messages_from_text(config_text, config_path)
+        except Exception as ex:
             found_config_file = True
-            state.log.detail("reading-in-tree-config", "reading configuration file", config_path)
-            try:
-                config_file_lines = config_path.read_text(encoding="utf-8").splitlines(keepends=True)
-                message_sequence = parse_messages(config_file_lines, config_path)
-            except Exception as ex:
-                state.log.error("read-config-file-exception", f"exception while reading configuration file: {repr(ex)}", config_path)
-                state.log.debug_exception(ex)
+            state.log.error("read-config-file-exception", f"exception while reading configuration file: {repr(ex)}", config_path)
+            state.log.debug_exception(ex)
         prapticonfig_mds.append((config_path, message_sequence))
         if message_sequence and is_config_root(message_sequence): # stop iterating once we hit a config file with `%config_root = true`
             break
@@ -165,4 +189,4 @@ def default_load_config_files(state: ExecutionState):
     # if no config file is present, use fallback config
     if not found_config_file:
         state.log.info("loading-fallback-config", "loading fallback configuration", state.input_file_path)
-        parse_messages_and_interpret_commands(FALLBACK_CONFIG_FILE_DATA.splitlines(keepends=True), pathlib.Path("<fallback-config>"), state)
+        parse_messages_and_interpret_commands(FALLBACK_CONFIG_FILE_DATA, FALLBACK_CONFIG_FILE_PATH, state)
@@ -89,6 +89,12 @@ class DiagnosticsLogger(metaclass=abc.ABCMeta):
     def debug(self, msg_id_or_msg: str, *msg_and_or_extras, **kwextras):
         pass
 
+    @abc.abstractmethod
+    def is_enabled_for(self, level: int) -> bool:
+        """Return True if messages at `level` would be emitted.
+        Use to skip building expensive messages that would be discarded."""
+        pass
+
     @abc.abstractmethod
     def error_exception(self, ex: BaseException):
         pass
@@ -214,6 +220,9 @@ class RootDiagnosticsLogger(DiagnosticsLogger):
     def debug(self, msg_id_or_msg: str, *msg_and_or_extras, **kwextras):
         self._log(logging.DEBUG, msg_id_or_msg, msg_and_or_extras, kwextras)
 
+    def is_enabled_for(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
     def error_exception(self, ex: BaseException):
         self.logger.error(ex, exc_info=True)
 
@@ -255,6 +264,9 @@ class ScopedDiagnosticsLogger(DiagnosticsLogger):
     def debug(self, msg_id_or_msg: str, *msg_and_or_extras, **kwextras):
         self.sink.debug(msg_id_or_msg, *msg_and_or_extras, **self._add_scopes(kwextras))
 
+    def is_enabled_for(self, level: int) -> bool:
+        return self.sink.is_enabled_for(level)
+
     def error_exception(self, ex: BaseException):
         self.sink.error_exception(ex)
 
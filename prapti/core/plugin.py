@@ -1,6 +1,7 @@
 """
     Plugins are dynamically loaded extensions.
 """
+import sys
 from enum import Flag, auto
 from typing import Any
 from dataclasses import dataclass
@@ -32,7 +33,7 @@ class Plugin:
     """Base class for plugins"""
     def __init__(self, api_version: str, name: str, version: str, description: str, capabilities: PluginCapabilities):
         self.api_version: str = api_version
-        self.name: str = name
+        self.name: str = sys.intern(name) # plugin names are used as dict keys throughout core
         self.version: str = version
         self.description: str = description
         self.capabilities: PluginCapabilities = capabilities
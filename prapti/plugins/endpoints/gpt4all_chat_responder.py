@@ -42,7 +42,7 @@ def convert_message_sequence_to_text_prompt(message_sequence: list[Message], log
         if not message.is_enabled or message.is_hidden:
             continue # skip disabled and hidden messages
 
-        if message.role not in ["system", "user", "assistant"]:
+        if message.role not in {"system", "user", "assistant"}:
             log.warning("unrecognised-public-role", f"message will not be included in LLM prompt. public role '{message.role}' is not recognised.", message.source_loc)
             continue
 
@@ -184,7 +184,7 @@ def convert_message_sequence_to_openai_messages(message_sequence: list[Message],
         if not message.is_enabled or message.is_hidden:
             continue # skip disabled and hidden messages
 
-        if message.role not in ["system", "user", "assistant"]:
+        if message.role not in {"system", "user", "assistant"}:
             log.warning("unrecognised-public-role", f"message will not be included in LLM prompt. public role '{message.role}' is not recognised.", message.source_loc)
             continue
 
@@ -17,7 +17,7 @@ from ..core._core_execution_state import CoreExecutionState, get_private_core_st
 from ..core.execution_state import ExecutionState
 from ..core.chat_markdown_parser import parse_messages
 from ..core.command_interpreter import interpret_commands
-from ..core.builtins import builtin_actions, lookup_active_responder
+from ..core.builtins import builtin_actions, lookup_active_responder, rescan_installed_plugin_entry_points
 from ..core.command_message import flatten_message_content, Message
 from ..core.load_configuration import load_config_file, default_load_config_files
 from .start_template import get_start_template
@@ -37,12 +37,13 @@ def make_argument_parser() -> argparse.ArgumentParser:
     result.add_argument("--no-default-config", help="disable default config file search", action="store_true")
     result.add_argument("--config-file", help="specify additional config file(s)", required=False, default=[], action="append")
     result.add_argument("--show-output", help="stream LLM output to standard output (in addition to updating file)", action="store_true")
+    result.add_argument("--rescan-plugins", help="rescan installed plugins, refreshing the plugin cache. the filename may be omitted", action="store_true")
 
     log_level_choices = [level.lower() for level in log_levels]
     result.add_argument("--log-level", help="specify the minimum level of log messages to be printed", choices=log_level_choices, required=False, default="info")
 
     # Positional argument for the filename
-    result.add_argument("filename", help="the current markdown conversation file")
+    result.add_argument("filename", help="the current markdown conversation file", nargs="?")
     return result
 
 argument_parser = make_argument_parser()
@@ -258,6 +259,14 @@ def run_phase_1(argv: Sequence[str] | None = None, test_exfil: dict|None = None,
     args = argv[1:] # parse_args doesn't want the command name
     command_line_args = argument_parser.parse_args(args=args)
 
+    if command_line_args.rescan_plugins:
+        rescan_installed_plugin_entry_points()
+        if command_line_args.filename is None:
+            return RunState(completed=True, result_code=ExitStatus.SUCCESS.value)
+
+    if command_line_args.filename is None:
+        argument_parser.error("the following arguments are required: filename") # exits
+
     log_level = log_levels.get(command_line_args.log_level.upper(), None)
     if not log_level:
         print(f"error: '{command_line_args.log_level}' is not a valid log level", file=sys.stderr, flush=True)
@@ -1,3 +1,4 @@
+from typing import Callable
 import shutil
 import pathlib
 import pytest
@@ -19,6 +20,13 @@ def temp_markdown_file_path(request, markdown_file_path) -> pathlib.Path:
     request.addfinalizer(cleanup)
     return tmp_md_path
 
+@pytest.fixture(scope="function", autouse=True)
+def tmp_xdg_cache_home(tmp_path_factory, monkeypatch) -> pathlib.Path:
+    # keep the plugin entry point cache out of the real user cache directory
+    result = tmp_path_factory.mktemp("tmp_xdg_cache_home")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(result))
+    return result
+
 @pytest.fixture(scope="function")
 def mock_user_home(tmp_path_factory, monkeypatch) -> pathlib.Path:
     result = tmp_path_factory.mktemp("mock_user_home")
@@ -40,3 +48,10 @@ def no_user_config(mock_user_home: pathlib.Path, monkeypatch) -> pathlib.Path:
     monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
     # leave mock user home empty. i.e. no user config
     return mock_user_home
+
+@pytest.fixture(scope="function")
+def logged_message_ids(caplog) -> Callable[[], set[str]]:
+    """Return a function that collects the message ids of all records logged so far"""
+    def collect_logged_message_ids() -> set[str]:
+        return {record.message_id for record in caplog.records if getattr(record, "message_id", None)}
+    return collect_logged_message_ids
@@ -0,0 +1,34 @@
+from prapti.core.action import ActionNamespace
+
+def _noop(name, raw_args, context):
+    return None
+
+def test_lookup_action_unique_unqualified_name():
+    actions = ActionNamespace()
+    actions._add_action("a.b.load", _noop)
+
+    for name in ("a.b.load", "b.load", "load"):
+        matches = actions.lookup_action(name)
+        assert len(matches) == 1
+        assert matches[0].qualified_name == "a.b.load"
+
+    assert actions.lookup_action("unload") == []
+
+def test_lookup_action_ambiguous_unqualified_name():
+    actions = ActionNamespace()
+    actions._add_action("x.load", _noop)
+    other_actions = ActionNamespace()
+    other_actions._add_action("y.load", _noop)
+    actions.merge(other_actions)
+
+    assert [action.qualified_name for action in actions.lookup_action("x.load")] == ["x.load"]
+    assert [action.qualified_name for action in actions.lookup_action("y.load")] == ["y.load"]
+    assert [action.qualified_name for action in actions.lookup_action("load")] == ["x.load", "y.load"]
+
+def test_lookup_action_exclamation_only():
+    actions = ActionNamespace()
+    actions._add_action("!a.inspect", _noop)
+
+    matches = actions.lookup_action("a.inspect")
+    assert len(matches) == 1
+    assert matches[0].exclamation_only
@@ -0,0 +1,21 @@
+from prapti.core.chat_markdown_parser import parse_messages, parse_messages_from_text
+
+PARSER_TEXT = """\
+% plugins.load prapti.test.test_config
+### @user:
+
+hello\u2028world
+% //disabled = 1
+### @assistant/bot:
+unterminated final line"""
+
+def test_parse_messages_from_text_matches_readlines():
+    """parse_messages_from_text splits lines like readlines(), i.e. only on newlines"""
+    lines = PARSER_TEXT.split("\n")
+    lines = [line + "\n" for line in lines[:-1]] + [lines[-1]]
+    expected = parse_messages(lines, None)
+    result = parse_messages_from_text(PARSER_TEXT, None)
+    assert repr(result) == repr(expected)
+    assert [(m.role, m.name) for m in result] == [("_head", None), ("user", None), ("assistant", "bot")]
+    assert result[1].content[0] == "\nhello\u2028world\n"
+    assert result[2].content == ["unterminated final line\n"]
@@ -1,3 +1,4 @@
+import os
 import pathlib
 import pytest
 
@@ -207,6 +208,29 @@ def test_prapticonfig_md(tmp_path: pathlib.Path, no_user_config, monkeypatch):
     state: ExecutionState = test_exfil["state"]
     assert state.root_config.responders.default.a_string == "Loaded from .prapticonfig.md"
 
+def test_non_regular_prapticonfig_md_is_ignored(tmp_path: pathlib.Path, no_user_config, monkeypatch):
+    """Test that a `.prapticonfig.md` that is not a regular file (a directory, or a FIFO where supported) is skipped without blocking"""
+    (tmp_path / ".prapticonfig.md").mkdir()
+    child_dir_path = tmp_path / "child"
+    child_dir_path.mkdir()
+    if hasattr(os, "mkfifo"):
+        os.mkfifo(child_dir_path / ".prapticonfig.md")
+
+    # minimal md input file
+    temp_md_path = child_dir_path / "test_non_regular_prapticonfig_md.md"
+    temp_md_path.write_text(MINIMAL_PROMPT_MD, encoding="utf-8")
+
+    monkeypatch.setattr("sys.argv", ["prapti", "--halt-on-error", "--dry-run", str(temp_md_path)])
+
+    import prapti.tool
+    test_exfil = {}
+    exit_status = prapti.tool.main(test_exfil=test_exfil)
+    assert exit_status == 0
+
+    state: ExecutionState = test_exfil["state"]
+    assert state.config_file_paths == [] # no config file found, the fallback configuration was used
+    assert hasattr(state.root_config.responders, "default")
+
 PRAPTICONFIG_MD_NO_RESPONDER = """\
 % plugins.load prapti.test.test_config
 % plugins.prapti.test.test_config.a_string = "Loaded from .prapticonfig.md"
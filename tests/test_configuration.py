@@ -0,0 +1,27 @@
+from prapti.core.configuration import RootConfiguration, VarRef, VarEntry, _assign_var_ref, resolve_var_refs
+from prapti.core.logger import create_root_diagnostics_logger
+from prapti.core.source_location import SourceLocation
+from prapti.plugins.prapti_test_config import TestConfigConfiguration
+
+def test_resolve_var_refs_multiple_fields(logged_message_ids):
+    """Resolve several var refs on one model, including one that fails validation"""
+    log = create_root_diagnostics_logger()
+    root_config = RootConfiguration()
+    root_config.vars.intvar = VarEntry(value=5)
+    root_config.vars.strvar = VarEntry(value="hello")
+
+    config = TestConfigConfiguration()
+    _assign_var_ref(config, "an_int", VarRef("intvar"), root_config)
+    _assign_var_ref(config, "a_string", VarRef("strvar"), root_config)
+
+    resolved = resolve_var_refs(config, root_config, log)
+    assert resolved.an_int == 5
+    assert resolved.a_string == "hello"
+    assert config.an_int == 0 and config.a_string == "test" # input is left unmodified
+    assert not logged_message_ids()
+
+    root_config.vars.intvar = VarEntry(value="not an int", value_source_loc=SourceLocation())
+    resolved = resolve_var_refs(config, root_config, log)
+    assert resolved.an_int == 0
+    assert resolved.a_string == "hello"
+    assert logged_message_ids() == {"invalid-late-bound-field-assignment"}
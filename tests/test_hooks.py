@@ -0,0 +1,39 @@
+from prapti.core.hooks import Hooks, HooksContext, HooksDistributor
+
+class _RecordingHooks(Hooks):
+    def __init__(self):
+        self.events: list[str] = []
+
+    def on_generating_response(self, context: HooksContext):
+        self.events.append("on_generating_response")
+
+    def on_lookup_active_responder(self, responder_name: str, context: HooksContext) -> str:
+        self.events.append("on_lookup_active_responder")
+        return "other"
+
+def _hooks_context(hooks: Hooks) -> HooksContext:
+    return HooksContext(state=None, root_config=None, plugin_config=None, hooks=hooks, log=None) # type: ignore
+
+def test_hooks_distributor_dispatch():
+    distributor = HooksDistributor()
+    distributor.on_plugin_loaded()
+    distributor.on_generating_response()
+    distributor.on_response_completed()
+    assert distributor.on_lookup_active_responder("default") == "default"
+
+    distributor.add_hooks(_hooks_context(Hooks()))
+    assert distributor.on_lookup_active_responder("default") == "default"
+
+    recording_hooks = _RecordingHooks()
+    recording_hooks_context = _hooks_context(recording_hooks)
+    distributor.add_hooks(recording_hooks_context)
+    distributor.on_plugin_loaded()
+    distributor.on_generating_response()
+    distributor.on_response_completed()
+    assert distributor.on_lookup_active_responder("default") == "other"
+    assert recording_hooks.events == ["on_generating_response", "on_lookup_active_responder"]
+
+    distributor.remove_hooks(recording_hooks_context)
+    distributor.on_generating_response()
+    assert distributor.on_lookup_active_responder("default") == "default"
+    assert recording_hooks.events == ["on_generating_response", "on_lookup_active_responder"]
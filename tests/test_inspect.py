@@ -0,0 +1,169 @@
+INSPECT_PROMPT = """\
+% plugins.load prapti.test.test_config
+% plugins.load prapti.test.test_responder
+% responder.new default prapti.test.test_responder
+% plugins.prapti.test.test_config.a_string = "hello"
+% plugins.prapti.test.test_responder.an_int = var(intvar)
+% intvar = 5
+% responders.default.a_list_of_strings = ["one", "two"]
+% model = "gpt-4"
+### @user:
+
+% !prapti.inspect
+"""
+
+INSPECT_EXPECTED_OUTPUT = """
+### //@_prapti/inspect:
+
+Configuration parameters:
+
+- `prapti`
+    - `config_root = false`
+    - `dry_run = true`
+    - `halt_on_error = true`
+    - `responder_stack = []`
+- `plugins`
+    - `prapti.test.test_config`
+        - `a_bool = false`
+        - `an_int = 0`
+        - `a_float = 0.0`
+        - `a_string = "hello"`
+        - `a_list_of_strings = []`
+    - `prapti.test.test_responder`
+        - `an_int = var(intvar) = 5`
+        - `a_string = "test"`
+- `responders`
+    - `default`
+        - `a_bool = false`
+        - `an_int = 0`
+        - `a_float = 0.0`
+        - `a_string = "test"`
+        - `a_list_of_strings = ["one", "two"]`
+        - `temperature = var(temperature) = (not set) ~> 1`
+        - `model = var(model) = "gpt-4"`
+        - `n = var(n) = 1`
+- `vars`
+    - `model = "gpt-4"`
+    - `temperature = (not set)`
+    - `n = 1`
+    - `stream = true`
+    - `intvar = 5`
+
+### @user:
+
+"""
+
+def test_inspect_config(tmp_path, monkeypatch):
+    """Test the output of the `!prapti.inspect` action"""
+    temp_md_path = tmp_path / "test_inspect_config_temp.md"
+    temp_md_path.write_text(INSPECT_PROMPT, encoding="utf-8")
+
+    monkeypatch.setattr("sys.argv", ["prapti", "--halt-on-error", "--dry-run", "--no-default-config", str(temp_md_path)])
+
+    import prapti.tool
+    exit_status = prapti.tool.main()
+    assert exit_status == 0
+
+    output_file_data = temp_md_path.read_text(encoding="utf-8")
+    assert output_file_data == INSPECT_PROMPT + INSPECT_EXPECTED_OUTPUT
+
+INSPECT_EMPTY_CONFIGS_PROMPT = """\
+% plugins.load prapti.test.test_actions
+% intvar = 5
+% x = var(intvar)
+### @user:
+
+% !prapti.inspect
+"""
+
+INSPECT_EMPTY_CONFIGS_EXPECTED_OUTPUT = """
+### //@_prapti/inspect:
+
+Configuration parameters:
+
+- `prapti`
+    - `config_root = false`
+    - `dry_run = true`
+    - `halt_on_error = true`
+    - `responder_stack = []`
+- `plugins`
+    - `prapti.test.test_actions` *(no parameters)*
+- `responders` *(no parameters)*
+- `vars`
+    - `model = (not set)`
+    - `temperature = (not set)`
+    - `n = 1`
+    - `stream = true`
+    - `intvar = 5`
+    - `x = var(intvar) = 5`
+
+### @user:
+
+"""
+
+def test_inspect_empty_configs(tmp_path, monkeypatch):
+    """Test the output of the `!prapti.inspect` action for empty configuration objects and var-to-var references"""
+    temp_md_path = tmp_path / "test_inspect_empty_configs_temp.md"
+    temp_md_path.write_text(INSPECT_EMPTY_CONFIGS_PROMPT, encoding="utf-8")
+
+    monkeypatch.setattr("sys.argv", ["prapti", "--halt-on-error", "--dry-run", "--no-default-config", str(temp_md_path)])
+
+    import prapti.tool
+    exit_status = prapti.tool.main()
+    assert exit_status == 0
+
+    output_file_data = temp_md_path.read_text(encoding="utf-8")
+    assert output_file_data == INSPECT_EMPTY_CONFIGS_PROMPT + INSPECT_EMPTY_CONFIGS_EXPECTED_OUTPUT
+
+INSPECT_AFTER_PLUGIN_LOAD_PROMPT = """\
+% plugins.load prapti.test.test_config
+### @user:
+
+% !prapti.inspect
+% plugins.load prapti.test.test_actions
+% !prapti.inspect
+"""
+
+def test_inspect_after_plugin_load(tmp_path, monkeypatch):
+    """Test that `!prapti.inspect` lists plugins that were loaded after a previous inspection"""
+    temp_md_path = tmp_path / "test_inspect_after_plugin_load_temp.md"
+    temp_md_path.write_text(INSPECT_AFTER_PLUGIN_LOAD_PROMPT, encoding="utf-8")
+
+    monkeypatch.setattr("sys.argv", ["prapti", "--halt-on-error", "--dry-run", "--no-default-config", str(temp_md_path)])
+
+    import prapti.tool
+    exit_status = prapti.tool.main()
+    assert exit_status == 0
+
+    output_file_data = temp_md_path.read_text(encoding="utf-8")
+    first_inspect_output, second_inspect_output = output_file_data[len(INSPECT_AFTER_PLUGIN_LOAD_PROMPT):].split("Configuration parameters:")[1:]
+    assert "`prapti.test.test_config`" in first_inspect_output
+    assert "`prapti.test.test_actions`" not in first_inspect_output
+    assert "`prapti.test.test_config`" in second_inspect_output
+    assert "`prapti.test.test_actions` *(no parameters)*" in second_inspect_output
+
+def test_inspect_nested_plugins_field_is_not_flattened():
+    """Only the root configuration's `plugins` namespace is listed flat. A plugin configuration
+    with its own `plugins` field is dumped like any other field"""
+    import pydantic
+    from prapti.core.builtins import _config_dump
+    from prapti.core.configuration import RootConfiguration
+    from prapti.core._core_execution_state import CoreExecutionState
+    from prapti.core.logger import create_root_diagnostics_logger
+
+    class NestedPluginsConfiguration(pydantic.BaseModel):
+        plugins: list[str] = ["one", "two"]
+
+    log = create_root_diagnostics_logger()
+    root_config = RootConfiguration()
+    setattr(root_config.plugins, "nested", NestedPluginsConfiguration())
+    core_state = CoreExecutionState()
+
+    output = "".join(_config_dump(root_config, indent=0, root_config=root_config, core_state=core_state, log=log))
+    assert "    - `nested`\n        - `plugins = [\"one\", \"two\"]`\n" in output
+
+    # the cached flat list belongs to the namespace it was collected from
+    other_plugins = type(root_config.plugins)()
+    root_config.plugins = other_plugins
+    output = "".join(_config_dump(root_config, indent=0, root_config=root_config, core_state=core_state, log=log))
+    assert "`nested`" not in output
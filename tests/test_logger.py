@@ -194,3 +194,16 @@ def test_logger_message_counters(log):
         if level in (logging.CRITICAL, logging.ERROR, logging.WARNING):
             continue
         assert message_count == 0, f"should be 0, no level {level} messages were logged"
+
+def test_logger_is_enabled_for(log):
+    """is_enabled_for reflects the underlying logger level, including through scoped loggers"""
+    scoped_log = prapti.core.logger.ScopedDiagnosticsLogger(log, "scope")
+    log.logger.setLevel(logging.INFO)
+    try:
+        assert log.is_enabled_for(logging.INFO)
+        assert not log.is_enabled_for(prapti.core.logger.DETAIL)
+        assert scoped_log.is_enabled_for(logging.INFO)
+        assert not scoped_log.is_enabled_for(prapti.core.logger.DETAIL)
+    finally:
+        log.logger.setLevel(logging.DEBUG)
+    assert scoped_log.is_enabled_for(prapti.core.logger.DETAIL)
@@ -1,26 +1,85 @@
 import importlib.metadata
+import os
 import pydantic
 from prapti.core.execution_state import ExecutionState
 from prapti.core.plugin import Plugin
-from prapti.core.builtins import installed_plugin_entry_points
+from prapti.core.builtins import get_installed_plugin_entry_points
+from prapti.core._entrypoint_cache import load_plugin_entry_points
 from prapti.plugins.prapti_test_config import TestConfigConfiguration
 from prapti.plugins.prapti_test_responder import TestResponderConfiguration
 
 def test_test_plugins_available():
     """Test that the test plugins are available"""
-    assert "prapti.test.test_config" in installed_plugin_entry_points
-    assert "prapti.test.test_responder" in installed_plugin_entry_points
-    assert "prapti.test.test_actions" in installed_plugin_entry_points
+    assert "prapti.test.test_config" in get_installed_plugin_entry_points()
+    assert "prapti.test.test_responder" in get_installed_plugin_entry_points()
+    assert "prapti.test.test_actions" in get_installed_plugin_entry_points()
 
 def test_entry_point_names_are_consistent_with_plugin_names():
     """A plugin's entry point name is set in `pyproject.toml`, whereas the plugin name is set
     in the prapti_plugin instance in the module containing the plugin.
     The two names must match. Prapti's plugin loading code depends on it."""
     entry_point: importlib.metadata.EntryPoint
-    for _, entry_point in installed_plugin_entry_points.items():
+    for _, entry_point in get_installed_plugin_entry_points().items():
         plugin: Plugin = entry_point.load()
         assert entry_point.name == plugin.name
 
+def test_plugin_entry_point_cache(tmp_xdg_cache_home):
+    """Test that discovered plugin entry points are cached on disk, and that cached entry points can be loaded"""
+    cache_file_path = tmp_xdg_cache_home / "prapti" / "entrypoints.json"
+
+    scanned_entry_points = load_plugin_entry_points()
+    assert cache_file_path.is_file()
+
+    cached_entry_points = load_plugin_entry_points()
+    assert {name: ep.value for name, ep in cached_entry_points.items()} == {name: ep.value for name, ep in scanned_entry_points.items()}
+
+    plugin: Plugin = cached_entry_points["prapti.test.test_config"].load()
+    assert plugin.name == "prapti.test.test_config"
+
+    cache_file_path.write_text("not json", encoding="utf-8") # a corrupt cache is ignored and rewritten
+    assert load_plugin_entry_points().keys() == scanned_entry_points.keys()
+
+def test_plugin_entry_point_cache_write_failure(tmp_xdg_cache_home):
+    """Test that a failed cache write is ignored and leaves no temporary file behind"""
+    cache_dir_path = tmp_xdg_cache_home / "prapti"
+    (cache_dir_path / "entrypoints.json").mkdir(parents=True) # the cache file can't be replaced by a rename
+
+    assert "prapti.test.test_config" in load_plugin_entry_points()
+    assert [path.name for path in cache_dir_path.iterdir()] == ["entrypoints.json"]
+
+def test_plugin_entry_point_cache_detects_rewritten_entry_points_txt(tmp_xdg_cache_home, tmp_path, monkeypatch):
+    """Test that rewriting a distribution's `entry_points.txt` in place invalidates the cache"""
+    dist_info_path = tmp_path / "foo-1.0.dist-info"
+    dist_info_path.mkdir()
+    (dist_info_path / "METADATA").write_text("Metadata-Version: 2.1\nName: foo\nVersion: 1.0\n", encoding="utf-8")
+    entry_points_txt_path = dist_info_path / "entry_points.txt"
+    entry_points_txt_path.write_text("[prapti.plugin]\nfoo.one = foo:one\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    entry_points = load_plugin_entry_points()
+    assert "foo.one" in entry_points and "foo.two" not in entry_points
+
+    # rewrite the file in place, keeping the directory modification times unchanged
+    dir_stats = [(path, path.stat()) for path in (tmp_path, dist_info_path)]
+    entry_points_txt_stat = entry_points_txt_path.stat()
+    entry_points_txt_path.write_text("[prapti.plugin]\nfoo.one = foo:one\nfoo.two = foo:two\n", encoding="utf-8")
+    os.utime(entry_points_txt_path, ns=(entry_points_txt_stat.st_atime_ns, entry_points_txt_stat.st_mtime_ns + 1_000_000_000))
+    for path, path_stat in dir_stats:
+        os.utime(path, ns=(path_stat.st_atime_ns, path_stat.st_mtime_ns))
+
+    entry_points = load_plugin_entry_points()
+    assert entry_points["foo.two"].value == "foo:two"
+
+def test_rescan_plugins_without_filename(tmp_xdg_cache_home, monkeypatch):
+    """Test that `prapti --rescan-plugins` can be run without an input file"""
+    monkeypatch.setattr("sys.argv", ["prapti", "--rescan-plugins"])
+
+    import prapti.tool
+    exit_status = prapti.tool.main()
+    assert exit_status == 0
+    assert (tmp_xdg_cache_home / "prapti" / "entrypoints.json").is_file()
+    assert "prapti.test.test_config" in get_installed_plugin_entry_points()
+
 LOAD_PlUGIN_PROMPT = """\
 % plugins.load prapti.test.test_config
 ### @user:
@@ -202,13 +261,6 @@ def test_set_late_bound_vars_responder_config(tmp_path, no_user_config, monkeypa
     assert resolved_config.model == "test model"
     assert resolved_config.n == 101
 
-def collect_logged_message_ids(caplog):
-    message_ids = set()
-    for record in caplog.records:
-        if getattr(record, "message_id", None):
-            message_ids.add(record.message_id)
-    return message_ids
-
 # NOTE: in the tests below, load a default responder so we don't get false-positive failures
 # due to "no default responder" errors.
 
@@ -220,7 +272,7 @@ TEST_SET_FIELD_OF_NONEXISTANT_PLUGIN = """\
 
 Hello
 """
-def test_set_field_of_nonexistant_plugin(tmp_path, no_user_config, monkeypatch, caplog):
+def test_set_field_of_nonexistant_plugin(tmp_path, no_user_config, monkeypatch, logged_message_ids):
     """Test that we get an error when setting a field of a non-existant plugin"""
     temp_md_path = tmp_path / "test_set_field_of_nonexistant_plugin_temp.md"
     temp_md_path.write_text(TEST_SET_FIELD_OF_NONEXISTANT_PLUGIN, encoding="utf-8")
@@ -231,7 +283,7 @@ def test_set_field_of_nonexistant_plugin(tmp_path, no_user_config, monkeypatch,
     exit_status = prapti.tool.main()
     assert exit_status != 0 # expect failure
 
-    message_ids = collect_logged_message_ids(caplog)
+    message_ids = logged_message_ids()
     assert "unknown-field-component" in message_ids
 
 TEST_SET_NONEXISTANT_PLUGIN_FIELD = """\
@@ -243,7 +295,7 @@ TEST_SET_NONEXISTANT_PLUGIN_FIELD = """\
 
 Hello
 """
-def test_set_nonexistant_plugin_field(tmp_path, no_user_config, monkeypatch, caplog):
+def test_set_nonexistant_plugin_field(tmp_path, no_user_config, monkeypatch, logged_message_ids):
     """Test that we get an error when setting a non-existant field of plugin configuration"""
     temp_md_path = tmp_path / "test_set_nonexistant_plugin_field_temp.md"
     temp_md_path.write_text(TEST_SET_NONEXISTANT_PLUGIN_FIELD, encoding="utf-8")
@@ -254,7 +306,7 @@ def test_set_nonexistant_plugin_field(tmp_path, no_user_config, monkeypatch, cap
     exit_status = prapti.tool.main()
     assert exit_status != 0 # expect failure
 
-    message_ids = collect_logged_message_ids(caplog)
+    message_ids = logged_message_ids()
     assert "unknown-field" in message_ids
 
 TEST_SET_PLUGIN_FIELD_WITH_INVALID_VALUE = """\
@@ -266,7 +318,7 @@ TEST_SET_PLUGIN_FIELD_WITH_INVALID_VALUE = """\
 
 Hello
 """
-def test_set_plugin_field_with_invalid_value(tmp_path, no_user_config, monkeypatch, caplog):
+def test_set_plugin_field_with_invalid_value(tmp_path, no_user_config, monkeypatch, logged_message_ids):
     """Test that we get a validation error when setting a field to an invalid value (assign non-numeric string to int field)"""
     temp_md_path = tmp_path / "test_set_plugin_field_with_invalid_value_temp.md"
     temp_md_path.write_text(TEST_SET_PLUGIN_FIELD_WITH_INVALID_VALUE, encoding="utf-8")
@@ -277,5 +329,25 @@ def test_set_plugin_field_with_invalid_value(tmp_path, no_user_config, monkeypat
     exit_status = prapti.tool.main()
     assert exit_status != 0 # expect failure
 
-    message_ids = collect_logged_message_ids(caplog)
+    message_ids = logged_message_ids()
     assert "invalid-field-assignment" in message_ids
+
+TEST_NEW_RESPONDER_BAD_ARGS = """\
+% responder.new default
+### @user:
+
+Hello
+"""
+def test_new_responder_bad_args(tmp_path, no_user_config, monkeypatch, logged_message_ids):
+    """Test that we get an error when responder.new is not given both a responder name and a plugin name"""
+    temp_md_path = tmp_path / "test_new_responder_bad_args_temp.md"
+    temp_md_path.write_text(TEST_NEW_RESPONDER_BAD_ARGS, encoding="utf-8")
+
+    monkeypatch.setattr("sys.argv", ["prapti", "--halt-on-error", "--dry-run", "--no-default-config", str(temp_md_path)])
+
+    import prapti.tool
+    exit_status = prapti.tool.main()
+    assert exit_status != 0 # expect failure
+
+    message_ids = logged_message_ids()
+    assert "responder-new-bad-args" in message_ids